@@ -9,8 +9,9 @@ import uuid
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import logging
-import time
-import json
+import orjson
+
+from generator_utils import pick_weighted, vpcs_by_environment
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,6 +19,25 @@ logger = logging.getLogger(__name__)
 class AWSInfrastructureGenerator:
     """Generates realistic AWS infrastructure topology and relationships"""
     
+    # Weighted draws as (population, cumulative weights), accumulated once for pick_weighted
+    _EKS_STATUSES = (("ACTIVE", "CREATING", "UPDATING"), (85, 95, 100))
+    _RDS_STATUSES = (("available", "backing-up", "modifying"), (90, 97, 100))
+    _EC2_STATUSES = (("running", "stopped", "pending"), (85, 95, 100))
+    _LB_STATES = (("active", "provisioning", "failed"), (90, 98, 100))
+    _WEB_SERVICE_STATUSES = (("running", "stopped", "updating", "failed"), (80, 90, 98, 100))
+    _SERVICE_STATUSES = (("healthy", "warning", "critical"), (75, 95, 100))
+    _APP_ENVIRONMENTS = (("production", "staging", "development"), (70, 90, 100))
+    _APP_STATUSES = (("active", "maintenance", "deprecated"), (85, 95, 100))
+    
+    # Fixed nested properties, serialized once and shared by every node that carries them
+    _LB_LISTENERS_JSON = orjson.dumps([
+        {"port": 443, "protocol": "HTTPS", "ssl_policy": "ELBSecurityPolicy-TLS-1-2-2017-01"},
+        {"port": 80, "protocol": "HTTP"}
+    ]).decode()
+    _HEALTH_CHECK_JSON = orjson.dumps({
+        "path": "/health", "interval": 30, "timeout": 5, "healthy_threshold": 2, "unhealthy_threshold": 3
+    }).decode()
+    
     def __init__(self, neo4j_uri: str = "bolt://graph:7687", auth: tuple = ("neo4j", "ubiquitous123")):
         self.driver = GraphDatabase.driver(neo4j_uri, auth=auth)
         
@@ -169,18 +189,22 @@ class AWSInfrastructureGenerator:
                 try:
                     session.run(constraint)
                 except Exception as e:
-                    logger.debug(f"Constraint might already exist: {e}")
+                    logger.debug("Constraint might already exist: %s", e)
             
             for index in indexes:
                 try:
                     session.run(index)
                 except Exception as e:
-                    logger.debug(f"Index might already exist: {e}")
+                    logger.debug("Index might already exist: %s", e)
+            
+            # Block until every index is ONLINE rather than guessing how long population takes
+            session.run("CALL db.awaitIndexes(300)").consume()
             
             logger.info("✅ Constraints and indexes created")
 
     def generate_vpcs(self, count: int = 4) -> List[Dict[str, Any]]:
         """Generate VPC infrastructure"""
+        now = datetime.utcnow()
         vpcs = []
         vpc_names = ["prod-main", "prod-secondary", "staging", "dev"]
         
@@ -193,7 +217,7 @@ class AWSInfrastructureGenerator:
                 "region": region,
                 "availability_zones": self.regions[region][:random.randint(2, 4)],
                 "environment": "production" if "prod" in vpc_names[i] else vpc_names[i],
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(30, 365))).isoformat()
+                "created_at": (now - timedelta(days=random.randint(30, 365))).isoformat()
             }
             vpcs.append(vpc)
             
@@ -201,14 +225,17 @@ class AWSInfrastructureGenerator:
 
     def generate_eks_clusters(self, vpcs: List[Dict], count: int = 6) -> List[Dict[str, Any]]:
         """Generate EKS clusters with realistic configuration"""
+        now = datetime.utcnow()
         clusters = []
         cluster_names = [
             "prod-trading-cluster", "prod-risk-cluster", "prod-portfolio-cluster", 
             "staging-apps-cluster", "dev-microservices-cluster", "prod-compliance-cluster"
         ]
         
+        eligible_vpcs = [v for v in vpcs if v["environment"] in ["production", "staging", "dev"]]
+        
         for i in range(min(count, len(cluster_names))):
-            vpc = random.choice([v for v in vpcs if v["environment"] in ["production", "staging", "dev"]])
+            vpc = random.choice(eligible_vpcs)
             node_groups = random.randint(2, 5)
             total_nodes = sum(random.randint(8, 25) for _ in range(node_groups))
             
@@ -222,9 +249,9 @@ class AWSInfrastructureGenerator:
                 "region": vpc["region"],
                 "vpc_id": vpc["vpc_id"],
                 "version": random.choice(["1.27", "1.28", "1.29"]),
-                "status": random.choices(["ACTIVE", "CREATING", "UPDATING"], weights=[85, 10, 5])[0],
+                "status": pick_weighted(self._EKS_STATUSES),
                 "endpoint": f"https://{uuid.uuid4().hex[:8].upper()}.gr7.{vpc['region']}.eks.amazonaws.com",
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(60, 400))).isoformat(),
+                "created_at": (now - timedelta(days=random.randint(60, 400))).isoformat(),
                 "node_groups": node_groups,
                 "total_nodes": total_nodes,
                 "instance_types": random.sample(self.instance_types["eks_nodes"], random.randint(2, 4)),
@@ -239,6 +266,7 @@ class AWSInfrastructureGenerator:
 
     def generate_rds_instances(self, vpcs: List[Dict], count: int = 8) -> List[Dict[str, Any]]:
         """Generate RDS database instances"""
+        now = datetime.utcnow()
         instances = []
         
         # PostgreSQL instances
@@ -258,8 +286,11 @@ class AWSInfrastructureGenerator:
         
         all_templates = pg_instances + oracle_instances
         
+        vpcs_by_env = vpcs_by_environment(vpcs)
+        
         for i, template in enumerate(all_templates[:count]):
-            vpc = random.choice([v for v in vpcs if v["environment"] == ("production" if "prod" in template["name"] or "legacy" in template["name"] else v["environment"])])
+            # Production/legacy databases stay in production VPCs; the rest may land in any VPC
+            vpc = random.choice(vpcs_by_env["production"] if "prod" in template["name"] or "legacy" in template["name"] else vpcs)
             
             # Determine instance class based on workload
             if "legacy" in template["name"] or "primary" in template["name"]:
@@ -286,7 +317,7 @@ class AWSInfrastructureGenerator:
                 "engine": template["engine"],
                 "engine_version": template["version"],
                 "instance_class": instance_class,
-                "status": random.choices(["available", "backing-up", "modifying"], weights=[90, 7, 3])[0],
+                "status": pick_weighted(self._RDS_STATUSES),
                 "region": vpc["region"],
                 "vpc_id": vpc["vpc_id"],
                 "allocated_storage": template["storage"],
@@ -297,7 +328,7 @@ class AWSInfrastructureGenerator:
                 "environment": vpc["environment"],
                 "subnet_group": f"{template['name'].split('-')[0]}-db-subnet-group",
                 "parameter_group": f"{template['engine']}-custom-{random.randint(1, 3)}",
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(90, 500))).isoformat()
+                "created_at": (now - timedelta(days=random.randint(90, 500))).isoformat()
             }
             
             if template["engine"] == "oracle-ee":
@@ -310,6 +341,7 @@ class AWSInfrastructureGenerator:
 
     def generate_ec2_sql_server_instances(self, vpcs: List[Dict], count: int = 4) -> List[Dict[str, Any]]:
         """Generate EC2 instances running SQL Server"""
+        now = datetime.utcnow()
         instances = []
         
         sql_server_templates = [
@@ -319,8 +351,10 @@ class AWSInfrastructureGenerator:
             {"name": "dev-sqlserver-01", "edition": "Express", "version": "2019", "license": "license_included"}
         ]
         
+        vpcs_by_env = vpcs_by_environment(vpcs)
+        
         for i, template in enumerate(sql_server_templates[:count]):
-            vpc = random.choice([v for v in vpcs if v["environment"] == ("production" if "prod" in template["name"] or i < 3 else "dev")])
+            vpc = random.choice(vpcs_by_env["production" if "prod" in template["name"] or i < 3 else "dev"])
             
             # Instance sizing based on edition
             if template["edition"] == "Enterprise":
@@ -342,13 +376,13 @@ class AWSInfrastructureGenerator:
             monthly_cost = compute_cost + storage_cost + license_cost
             
             instance = {
-                "instance_id": f"i-{random.randint(0, 2**64):016x}",
+                "instance_id": f"i-{random.getrandbits(64):016x}",
                 "name": template["name"],
                 "instance_type": instance_type,
                 "region": vpc["region"],
                 "vpc_id": vpc["vpc_id"],
                 "availability_zone": random.choice(vpc["availability_zones"]),
-                "status": random.choices(["running", "stopped", "pending"], weights=[85, 10, 5])[0],
+                "status": pick_weighted(self._EC2_STATUSES),
                 "private_ip": f"10.{random.randint(0, 255)}.{random.randint(1, 254)}.{random.randint(10, 250)}",
                 "subnet_id": f"subnet-{random.randint(10000, 99999):05x}",
                 "security_groups": [f"sg-sqlserver-{random.choice(['prod', 'staging', 'dev'])}"],
@@ -360,7 +394,7 @@ class AWSInfrastructureGenerator:
                 "memory_utilization": random.uniform(25, 85),
                 "storage_gb": storage_gb,
                 "environment": vpc["environment"],
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(120, 600))).isoformat()
+                "created_at": (now - timedelta(days=random.randint(120, 600))).isoformat()
             }
             instances.append(instance)
             
@@ -368,6 +402,7 @@ class AWSInfrastructureGenerator:
 
     def generate_load_balancers(self, vpcs: List[Dict], count: int = 8) -> List[Dict[str, Any]]:
         """Generate AWS Application Load Balancers"""
+        now = datetime.utcnow()
         load_balancers = []
         
         lb_templates = [
@@ -381,8 +416,10 @@ class AWSInfrastructureGenerator:
             {"name": "monitoring-alb", "scheme": "internal", "type": "application"}
         ]
         
+        vpcs_by_env = vpcs_by_environment(vpcs)
+        
         for i, template in enumerate(lb_templates[:count]):
-            vpc = random.choice([v for v in vpcs if v["environment"] == ("production" if "prod" in template["name"] or i < 5 else "dev")])
+            vpc = random.choice(vpcs_by_env["production" if "prod" in template["name"] or i < 5 else "dev"])
             
             # Calculate costs based on load balancer type
             if template["type"] == "application":
@@ -411,19 +448,9 @@ class AWSInfrastructureGenerator:
                 "availability_zones": random.sample(vpc["availability_zones"], min(2, len(vpc["availability_zones"]))),
                 "subnets": [f"subnet-{random.randint(10000, 99999):05x}" for _ in range(2)],
                 "security_groups": [f"sg-{template['name']}-lb"],
-                "state": random.choices(["active", "provisioning", "failed"], weights=[90, 8, 2])[0],
+                "state": pick_weighted(self._LB_STATES),
                 "ip_address_type": random.choice(["ipv4", "dualstack"]),
-                "listeners_json": json.dumps([
-                    {
-                        "port": 443,
-                        "protocol": "HTTPS",
-                        "ssl_policy": "ELBSecurityPolicy-TLS-1-2-2017-01"
-                    },
-                    {
-                        "port": 80,
-                        "protocol": "HTTP"
-                    }
-                ]),
+                "listeners_json": self._LB_LISTENERS_JSON,
                 "target_groups": random.randint(2, 5),
                 "targets_healthy": random.randint(2, 8),
                 "targets_total": random.randint(4, 10),
@@ -431,7 +458,7 @@ class AWSInfrastructureGenerator:
                 "cost_monthly": round(monthly_cost, 2),
                 "environment": vpc["environment"],
                 "tier": "loadbalancer",
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(30, 365))).isoformat()
+                "created_at": (now - timedelta(days=random.randint(30, 365))).isoformat()
             }
             load_balancers.append(load_balancer)
             
@@ -439,6 +466,7 @@ class AWSInfrastructureGenerator:
 
     def generate_web_services(self, vpcs: List[Dict], count: int = 12) -> List[Dict[str, Any]]:
         """Generate Web Services and Frontend applications"""
+        now = datetime.utcnow()
         web_services = []
         
         web_service_templates = [
@@ -456,8 +484,10 @@ class AWSInfrastructureGenerator:
             {"name": "data-visualization", "technology": "D3.js", "framework": "Observable", "port": 3005}
         ]
         
+        vpcs_by_env = vpcs_by_environment(vpcs)
+        
         for i, template in enumerate(web_service_templates[:count]):
-            vpc = random.choice([v for v in vpcs if v["environment"] == ("production" if i < 8 else "dev")])
+            vpc = random.choice(vpcs_by_env["production" if i < 8 else "dev"])
             
             # Calculate costs based on service type and technology
             if template["technology"] in ["React", "Angular", "Vue.js"]:
@@ -489,22 +519,16 @@ class AWSInfrastructureGenerator:
                 "cpu_cores": random.uniform(0.5, 4.0),
                 "memory_gb": random.randint(1, 8),
                 "storage_gb": random.randint(10, 100),
-                "auto_scaling_json": json.dumps({
+                "auto_scaling_json": orjson.dumps({
                     "enabled": random.choice([True, False]),
                     "min_instances": random.randint(1, 3),
                     "max_instances": random.randint(5, 15),
                     "target_cpu": random.randint(60, 80)
-                }),
-                "health_check_json": json.dumps({
-                    "path": "/health",
-                    "interval": 30,
-                    "timeout": 5,
-                    "healthy_threshold": 2,
-                    "unhealthy_threshold": 3
-                }),
+                }).decode(),
+                "health_check_json": self._HEALTH_CHECK_JSON,
                 "ssl_certificate": f"arn:aws:acm:{vpc['region']}:123456789012:certificate/{random.randint(10000000, 99999999)}",
                 "domain": f"{template['name']}.{random.choice(['internal', 'api', 'app'])}.capitalgroupcorp.com",
-                "status": random.choices(["running", "stopped", "updating", "failed"], weights=[80, 10, 8, 2])[0],
+                "status": pick_weighted(self._WEB_SERVICE_STATUSES),
                 "cpu_utilization": random.uniform(10, 85),
                 "memory_utilization": random.uniform(20, 90),
                 "request_count": random.randint(1000, 100000),
@@ -513,7 +537,7 @@ class AWSInfrastructureGenerator:
                 "cost_monthly": round(monthly_cost, 2),
                 "environment": vpc["environment"],
                 "tier": "web",
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(30, 180))).isoformat()
+                "created_at": (now - timedelta(days=random.randint(30, 180))).isoformat()
             }
             web_services.append(web_service)
             
@@ -521,6 +545,7 @@ class AWSInfrastructureGenerator:
 
     def generate_services(self, clusters: List[Dict], count: int = 22) -> List[Dict[str, Any]]:
         """Generate microservices and applications with proper cluster assignments"""
+        now = datetime.utcnow()
         services = []
         
         for i, template in enumerate(self.service_templates[:count]):
@@ -552,7 +577,7 @@ class AWSInfrastructureGenerator:
                 "name": template["name"],
                 "type": template["type"],
                 "environment": target_cluster["environment"],
-                "status": random.choices(["healthy", "warning", "critical"], weights=[75, 20, 5])[0],
+                "status": pick_weighted(self._SERVICE_STATUSES),
                 "version": f"{random.randint(1, 5)}.{random.randint(0, 9)}.{random.randint(0, 9)}",
                 "port": template["port"],
                 "protocol": random.choice(["HTTP/2", "HTTPS", "gRPC", "WebSocket"]),
@@ -568,7 +593,7 @@ class AWSInfrastructureGenerator:
                 "cluster_name": template["cluster"],
                 "namespace": template["cluster"].split("-")[1] if "-" in template["cluster"] else "default",
                 "criticality": template["criticality"],
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(30, 200))).isoformat(),
+                "created_at": (now - timedelta(days=random.randint(30, 200))).isoformat(),
                 "dependencies": []  # Will be populated in relationships
             }
             services.append(service)
@@ -577,6 +602,7 @@ class AWSInfrastructureGenerator:
     
     def generate_external_saas_services(self) -> List[Dict[str, Any]]:
         """Generate external SaaS service dependencies with monitoring data"""
+        now = datetime.utcnow()
         external_services = []
         
         for template in self.external_saas_services:
@@ -612,13 +638,13 @@ class AWSInfrastructureGenerator:
                 "cost_monthly": template["cost_monthly"],
                 "criticality": template["criticality"],
                 "compliance": template["compliance"],
-                "monitoring_metrics_json": json.dumps(monitoring_data),
-                "last_health_check": datetime.utcnow().isoformat(),
+                "monitoring_metrics_json": orjson.dumps(monitoring_data).decode(),
+                "last_health_check": now.isoformat(),
                 "response_time_p95": round(random.uniform(20, 300), 2),
                 "dependency_risk_score": round(random.uniform(0.1, 0.8), 2),
                 "data_sovereignty": random.choice(["US", "EU", "Global"]),
                 "security_grade": random.choice(["A+", "A", "A-", "B+", "B"]),
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(180, 1000))).isoformat()
+                "created_at": (now - timedelta(days=random.randint(180, 1000))).isoformat()
             }
             external_services.append(external_service)
             
@@ -626,14 +652,15 @@ class AWSInfrastructureGenerator:
 
     def generate_applications(self, count: int = 6) -> List[Dict[str, Any]]:
         """Generate business applications"""
+        now = datetime.utcnow()
         applications = []
         
         for i, template in enumerate(self.application_templates[:count]):
             app = {
                 "name": template["name"],
                 "type": template["type"],
-                "environment": random.choices(["production", "staging", "development"], weights=[70, 20, 10])[0],
-                "status": random.choices(["active", "maintenance", "deprecated"], weights=[85, 10, 5])[0],
+                "environment": pick_weighted(self._APP_ENVIRONMENTS),
+                "status": pick_weighted(self._APP_STATUSES),
                 "version": f"{random.randint(1, 10)}.{random.randint(0, 20)}.{random.randint(0, 50)}",
                 "business_criticality": template["criticality"],
                 "compliance_requirements": template["compliance"],
@@ -641,7 +668,7 @@ class AWSInfrastructureGenerator:
                 "cost_center": f"{template['name'][:2].upper()}-{random.randint(100, 999)}",
                 "users": random.randint(50, 5000),
                 "transactions_per_day": random.randint(10000, 1000000),
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(200, 1000))).isoformat()
+                "created_at": (now - timedelta(days=random.randint(200, 1000))).isoformat()
             }
             applications.append(app)
             
@@ -1102,7 +1129,6 @@ class AWSInfrastructureGenerator:
                 self.clear_existing_data()
             
             self.create_constraints_and_indexes()
-            time.sleep(2)  # Give Neo4j time to process constraints
             
             self.create_infrastructure_nodes()
             self.create_relationships()
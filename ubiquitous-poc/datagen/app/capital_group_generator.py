@@ -10,12 +10,21 @@ from typing import List, Dict, Any, Optional
 import logging
 import json
 
+from generator_utils import pick_weighted
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class CapitalGroupDataGenerator:
     """Generates Capital Group specific infrastructure data for convincing demo"""
     
+    # Weighted draws as (population, cumulative weights), accumulated once for pick_weighted
+    _INCIDENT_STATUSES = (("resolved", "investigating", "monitoring"), (85, 95, 100))
+    _INCIDENT_PRIORITIES = (("P1", "P2", "P3"), (20, 80, 100))
+    _OPTIMIZATION_PRIORITIES = (("High", "Medium", "Low"), (30, 80, 100))
+    _OPTIMIZATION_STATUSES = (("identified", "approved", "in_progress", "completed"), (40, 70, 90, 100))
+    _CONFIDENCE_LEVELS = (("High", "Medium", "Low"), (60, 90, 100))
+    
     def __init__(self):
         # Capital Group organizational structure
         self.divisions = {
@@ -323,7 +332,7 @@ class CapitalGroupDataGenerator:
                 "category": template["category"],
                 "severity": template["severity"],
                 "business_impact": template["business_impact"],
-                "status": random.choices(["resolved", "investigating", "monitoring"], weights=[85, 10, 5])[0],
+                "status": pick_weighted(self._INCIDENT_STATUSES),
                 "affected_services": template["affected_services"],
                 "root_cause": template["root_cause"],
                 "resolution": template["resolution"] if random.random() < 0.85 else "Under investigation",
@@ -333,7 +342,7 @@ class CapitalGroupDataGenerator:
                 "revenue_impact": template["revenue_impact"],
                 "users_affected": template["users_affected"],
                 "assigned_team": random.choice(["Infrastructure", "Platform Engineering", "Trading Support", "Risk Technology"]),
-                "priority": random.choices(["P1", "P2", "P3"], weights=[20, 60, 20])[0],
+                "priority": pick_weighted(self._INCIDENT_PRIORITIES),
                 "escalated": random.choice([True, False]),
                 "communication_sent": True,
                 "post_mortem_required": True if template["severity"] in ["critical", "high"] else False,
@@ -498,11 +507,11 @@ resource "aws_s3_bucket_lifecycle_configuration" "backup_lifecycle" {
             optimizations.append({
                 **scenario,
                 "id": f"OPT-{random.randint(10000, 99999)}",
-                "priority": random.choices(["High", "Medium", "Low"], weights=[30, 50, 20])[0],
-                "status": random.choices(["identified", "approved", "in_progress", "completed"], weights=[40, 30, 20, 10])[0],
+                "priority": pick_weighted(self._OPTIMIZATION_PRIORITIES),
+                "status": pick_weighted(self._OPTIMIZATION_STATUSES),
                 "identified_date": (datetime.utcnow() - timedelta(days=random.randint(1, 60))).isoformat(),
                 "target_completion": (datetime.utcnow() + timedelta(weeks=random.randint(2, 12))).isoformat(),
-                "confidence_level": random.choices(["High", "Medium", "Low"], weights=[60, 30, 10])[0],
+                "confidence_level": pick_weighted(self._CONFIDENCE_LEVELS),
                 "validation_required": True if scenario["risk"] in ["Medium", "High"] else False,
                 "stakeholder_approval": "Required" if scenario["annual_savings"] > 1000000 else "Not Required",
                 "tags": [scenario["category"], scenario["business_unit"].lower().replace(" ", "_"), scenario["resource_type"].lower()]
@@ -7,9 +7,12 @@ Coordinates infrastructure and metrics data generation across all databases
 import asyncio
 import logging
 import os
+import random
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
 import asyncpg
+import orjson
 from neo4j import AsyncGraphDatabase
 import redis.asyncio as redis
 
@@ -17,12 +20,19 @@ from aws_infrastructure_generator import AWSInfrastructureGenerator
 from metrics_generator import MetricsGenerator
 
 
+class MetricsConnection(asyncpg.Connection):
+    """Pooled TimescaleDB connection that keeps its prepared metric inserts"""
+    
+    insert_statements: Dict[str, Any]
+
+
 class DatabasePopulator:
     """Orchestrates data population across Neo4j, TimescaleDB, and Redis"""
     
     def __init__(self):
         self.logger = self._setup_logging()
         self.pg_pool: Optional[asyncpg.Pool] = None
+        self.pg_realtime_pool: Optional[asyncpg.Pool] = None
         self.neo4j_driver = None
         self.redis_client = None
         
@@ -39,7 +49,29 @@ class DatabasePopulator:
         # Parse database URLs for connection config
         self.config = {
             'postgres': {
-                'dsn': database_url
+                'dsn': database_url,
+                # Bulk regeneration pool: wide parallel inserts, durability relaxed
+                'bulk': {
+                    'min_size': 4,
+                    'max_size': 32,
+                    'command_timeout': 300,
+                    'server_settings': {
+                        'jit': 'off',
+                        'synchronous_commit': 'off',
+                        'application_name': 'populator'
+                    }
+                },
+                # Real-time pool: small, fully durable commits
+                'realtime': {
+                    'min_size': 1,
+                    'max_size': 4,
+                    'command_timeout': 60,
+                    'server_settings': {
+                        'jit': 'off',
+                        'synchronous_commit': 'on',
+                        'application_name': 'populator_realtime'
+                    }
+                }
             },
             'neo4j': {
                 'uri': neo4j_url.split('@')[1] if '@' in neo4j_url else neo4j_url,
@@ -74,8 +106,15 @@ class DatabasePopulator:
             self.logger.info("Connecting to TimescaleDB...")
             self.pg_pool = await asyncpg.create_pool(
                 self.config['postgres']['dsn'],
-                min_size=2,
-                max_size=10
+                connection_class=MetricsConnection,
+                init=self._init_pg_connection,
+                **self.config['postgres']['bulk']
+            )
+            self.pg_realtime_pool = await asyncpg.create_pool(
+                self.config['postgres']['dsn'],
+                connection_class=MetricsConnection,
+                init=self._init_pg_connection,
+                **self.config['postgres']['realtime']
             )
             
             # Neo4j
@@ -102,6 +141,21 @@ class DatabasePopulator:
             self.logger.error(f"Database connection failed: {e}")
             return False
     
+    async def _init_pg_connection(self, conn: MetricsConnection):
+        """Give each new pooled connection its own prepared insert registry"""
+        conn.insert_statements = {}
+    
+    async def _get_insert_statement(self, conn: MetricsConnection, table_name: str, columns: List[str]):
+        """Prepare a metrics insert once per connection and reuse it across batches"""
+        placeholders = ', '.join([f'${i+1}' for i in range(len(columns))])
+        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        
+        stmt = conn.insert_statements.get(query)
+        if stmt is None:
+            stmt = await conn.prepare(query)
+            conn.insert_statements[query] = stmt
+        return stmt
+    
     async def _test_connections(self):
         """Test all database connections"""
         # Test PostgreSQL
@@ -141,11 +195,11 @@ class DatabasePopulator:
                 node_type = node['type']
                 properties = {k: v for k, v in node.items() if k != 'type'}
                 
-                # Create Cypher query for node
-                props_str = ', '.join([f"{k}: ${k}" for k in properties.keys()])
-                query = f"CREATE (n:{node_type} {{ {props_str} }})"
+                # Properties go in as one map so the query text (and its cached plan)
+                # only varies by label, not by each node's key set
+                query = f"CREATE (n:{node_type}) SET n = $props"
                 
-                await session.run(query, **properties)
+                await session.run(query, props=properties)
             
             # Create relationships
             for rel in infrastructure.get('relationships', []):
@@ -167,9 +221,8 @@ class DatabasePopulator:
             async with self.neo4j_driver.session() as session:
                 # Cache node counts by type
                 result = await session.run("MATCH (n) RETURN labels(n)[0] as type, count(n) as count")
-                node_counts = {}
-                async for record in result:
-                    node_counts[record["type"]] = record["count"]
+                rows = await result.data()
+                node_counts = {row["type"]: row["count"] for row in rows}
                 
                 if node_counts:
                     await self.redis_client.hset("infra:node_counts", mapping=node_counts)
@@ -180,13 +233,14 @@ class DatabasePopulator:
                     RETURN c.name as name, c.region as region, c.status as status, c.cost_monthly as cost_monthly
                 """)
                 
-                async for record in cluster_result:
+                for record in await cluster_result.data():
                     cluster_data = {
                         'region': record["region"] or 'unknown',
                         'status': record["status"] or 'unknown',  
                         'cost_monthly': record["cost_monthly"] or 0
                     }
-                    await self.redis_client.hset(f"cluster:{record['name']}", mapping=cluster_data)
+                    # Fixed-schema entry read back whole, so store one JSON value
+                    await self.redis_client.set(f"cluster:{record['name']}", orjson.dumps(cluster_data))
                 
                 # Cache total cost information
                 cost_result = await session.run("MATCH (n) RETURN sum(n.cost_monthly) as total_cost")
@@ -266,9 +320,10 @@ class DatabasePopulator:
             
             return components
     
-    async def _insert_metrics_batch(self, metrics_batch: Dict[str, List[Dict]]):
+    async def _insert_metrics_batch(self, metrics_batch: Dict[str, List[Dict]], realtime: bool = False):
         """Insert a batch of metrics into TimescaleDB"""
-        async with self.pg_pool.acquire() as conn:
+        pool = self.pg_realtime_pool if realtime else self.pg_pool
+        async with pool.acquire() as conn:
             for table_name, records in metrics_batch.items():
                 if not records:
                     continue
@@ -276,13 +331,12 @@ class DatabasePopulator:
                 # Get table columns
                 columns = list(records[0].keys())
                 
-                # Prepare insert query
-                placeholders = ', '.join([f'${i+1}' for i in range(len(columns))])
-                query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+                # Reuse the connection's server-side prepared insert
+                stmt = await self._get_insert_statement(conn, table_name, columns)
                 
                 # Execute batch insert
                 values_list = [[record[col] for col in columns] for record in records]
-                await conn.executemany(query, values_list)
+                await stmt.executemany(values_list)
     
     async def _refresh_continuous_aggregates(self):
         """Refresh TimescaleDB continuous aggregates"""
@@ -304,23 +358,29 @@ class DatabasePopulator:
         
         components = await self._get_infrastructure_components()
         
+        # Jittered exponential backoff so failing workers don't retry in lockstep
+        backoff = 1.0
+        backoff_cap = 60.0
+        
         while True:
             try:
                 # Generate current metrics
                 current_metrics = self.metrics_generator.generate_realtime_metrics(components)
                 
                 # Insert into database
-                await self._insert_metrics_batch(current_metrics)
+                await self._insert_metrics_batch(current_metrics, realtime=True)
                 
                 # Cache latest metrics in Redis for fast access
                 await self._cache_latest_metrics(current_metrics)
+                backoff = 1.0
                 
                 # Wait for next interval
                 await asyncio.sleep(60)  # 1-minute intervals for real-time
                 
             except Exception as e:
                 self.logger.error(f"Real-time generation error: {e}")
-                await asyncio.sleep(5)  # Short retry delay
+                await asyncio.sleep(random.uniform(0.5, backoff))
+                backoff = min(backoff_cap, backoff * 2)
     
     async def _cache_latest_metrics(self, metrics: Dict[str, List[Dict]]):
         """Cache latest metrics in Redis for dashboard queries"""
@@ -329,6 +389,12 @@ class DatabasePopulator:
                 if not records:
                     continue
                 
+                # Records within a table share one schema, so resolve the cached
+                # field order once and pull values with a single itemgetter call.
+                # Each entry is read back whole, so it is stored as one JSON value.
+                fields = tuple(k for k in records[0] if k != 'time')
+                getter = itemgetter(*fields)
+                
                 # Cache latest values by service/cluster
                 for record in records:
                     key_parts = []
@@ -339,11 +405,11 @@ class DatabasePopulator:
                     
                     if key_parts:
                         cache_key = f"latest:{table_name}:{':'.join(key_parts)}"
-                        await self.redis_client.hset(cache_key, mapping={
-                            k: str(v) for k, v in record.items() 
-                            if k != 'time'
-                        })
-                        await self.redis_client.expire(cache_key, 300)  # 5-minute expiry
+                        values = getter(record) if len(fields) > 1 else (getter(record),)
+                        await self.redis_client.set(
+                            cache_key, orjson.dumps(dict(zip(fields, values))),
+                            ex=300  # 5-minute expiry
+                        )
         
         except Exception as e:
             self.logger.error(f"Redis caching failed: {e}")
@@ -364,9 +430,8 @@ class DatabasePopulator:
                     RETURN labels(n)[0] as type, count(n) as count
                 """)
                 
-                node_counts = {}
-                async for record in result:
-                    node_counts[record['type']] = record['count']
+                rows = await result.data()
+                node_counts = {row['type']: row['count'] for row in rows}
                 
                 status['infrastructure']['nodes'] = node_counts
                 status['infrastructure']['total_nodes'] = sum(node_counts.values())
@@ -407,6 +472,9 @@ class DatabasePopulator:
             if self.pg_pool:
                 await self.pg_pool.close()
             
+            if self.pg_realtime_pool:
+                await self.pg_realtime_pool.close()
+            
             if self.neo4j_driver:
                 await self.neo4j_driver.close()
             
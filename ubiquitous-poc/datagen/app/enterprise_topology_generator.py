@@ -3,33 +3,334 @@ Enterprise-Scale Infrastructure Topology Generator
 Creates 50,000+ nodes for Wizard of Oz MVP demo that will impress executives
 """
 
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, AsyncGraphDatabase
+import numpy as np
 import random
 import uuid
 import string
+import sys
 import itertools
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 import logging
 import time
 import json
+import os
+import csv
+import orjson
+import queue
+import threading
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from generator_utils import vpcs_by_environment
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# UNWIND $rows node inserts used by the single-writer bulk load. Each commits server-side in
+# 1000-row transactions (CALL { } IN TRANSACTIONS), so they must run as auto-commit queries
+VPC_INSERT_QUERY = """
+    UNWIND $rows as vpc
+    CALL {
+        WITH vpc
+        CREATE (v:VPC:AWSResource {
+            vpc_id: vpc.vpc_id, name: vpc.name, cidr_block: vpc.cidr_block,
+            region: vpc.region, environment: vpc.environment, type: 'VPC',
+            availability_zones: vpc.availability_zones, created_at: vpc.created_at,
+            business_criticality: vpc.business_criticality, dns_hostnames: vpc.dns_hostnames,
+            dns_resolution: vpc.dns_resolution, tags_json: vpc.tags_json
+        })
+    } IN TRANSACTIONS OF 1000 ROWS
+"""
+
+EKS_CLUSTER_INSERT_QUERY = """
+    UNWIND $rows as cluster
+    CALL {
+        WITH cluster
+        CREATE (c:EKSCluster:AWSResource {
+            name: cluster.name, arn: cluster.arn, region: cluster.region, vpc_id: cluster.vpc_id,
+            version: cluster.version, status: cluster.status, endpoint: cluster.endpoint,
+            created_at: cluster.created_at, node_groups: cluster.node_groups,
+            total_nodes: cluster.total_nodes, primary_instance_type: cluster.primary_instance_type,
+            cost_monthly: cluster.cost_monthly, environment: cluster.environment,
+            business_unit: cluster.business_unit, subnet_ids: cluster.subnet_ids,
+            security_groups: cluster.security_groups, logging_json: cluster.logging_json,
+            addons: cluster.addons, type: 'EKS'
+        })
+    } IN TRANSACTIONS OF 1000 ROWS
+"""
+
+# Pods are sent as positional rows (no per-pod dict); POD_FIELDS fixes the column order
+POD_FIELDS = (
+    "name", "namespace", "cluster_name", "status", "phase", "service_name",
+    "business_unit", "environment", "node_name", "pod_ip", "host_ip",
+    "start_time", "restart_count", "cpu_request", "cpu_limit",
+    "memory_request", "memory_limit", "technology_stack", "language",
+    "framework", "container_image", "container_port", "liveness_probe",
+    "readiness_probe", "volumes", "labels_json"
+)
+
+POD_INSERT_QUERY = """
+    UNWIND $rows as pod
+    CALL {
+        WITH pod
+        CREATE (p:Pod {%s})
+    } IN TRANSACTIONS OF 1000 ROWS
+""" % ", ".join(f"{field}: pod[{i}]" for i, field in enumerate(POD_FIELDS))
+
+# Bulk mode: pods are written to a CSV in the directory shared with Neo4j's import dir and
+# loaded with LOAD CSV, skipping Bolt parameter encoding for the largest node set
+NEO4J_IMPORT_DIR = os.getenv("NEO4J_IMPORT_DIR")
+POD_CSV_FILE = "enterprise_pods.csv"
+POD_CSV_CASTS = {
+    "restart_count": "toInteger", "container_port": "toInteger", "volumes": "toInteger",
+    "liveness_probe": "toBoolean", "readiness_probe": "toBoolean"
+}
+
+POD_LOAD_CSV_QUERY = """
+    LOAD CSV WITH HEADERS FROM 'file:///%s' AS row
+    CALL {
+        WITH row
+        CREATE (p:Pod {%s})
+    } IN TRANSACTIONS OF 1000 ROWS
+""" % (POD_CSV_FILE, ", ".join(
+    f"{field}: {POD_CSV_CASTS[field]}(row.{field})" if field in POD_CSV_CASTS else f"{field}: row.{field}"
+    for field in POD_FIELDS
+))
+
+# Replicas merge the primary's properties with their delta before the write; copying the
+# primary first would briefly duplicate its identifier and arn on a labeled node and
+# trip the unique constraints
+RDS_INSERT_QUERY = """
+    UNWIND $rows as db
+    CALL {
+        WITH db
+        CREATE (d:RDSInstance:AWSResource {
+            identifier: db.identifier, arn: db.arn, engine: db.engine,
+            engine_version: db.engine_version, instance_class: db.instance_class,
+            status: db.status, region: db.region, vpc_id: db.vpc_id,
+            allocated_storage: db.allocated_storage, storage_type: db.storage_type,
+            multi_az: db.multi_az, backup_retention: db.backup_retention,
+            cost_monthly: db.cost_monthly, environment: db.environment,
+            business_unit: db.business_unit, purpose: db.purpose,
+            subnet_group: db.subnet_group, parameter_group: db.parameter_group,
+            option_group: db.option_group, created_at: db.created_at,
+            connections_active: db.connections_active, connections_max: db.connections_max,
+            cpu_utilization: db.cpu_utilization, memory_utilization: db.memory_utilization,
+            storage_utilization: db.storage_utilization, iops_used: db.iops_used,
+            read_latency: db.read_latency, write_latency: db.write_latency,
+            read_replica_source: db.read_replica_source, replica_lag: db.replica_lag,
+            license_model: db.license_model, character_set: db.character_set,
+            national_character_set: db.national_character_set, type: 'RDS'
+        })
+        WITH d, db
+        UNWIND db.replicas as delta
+        CREATE (r:RDSInstance:AWSResource)
+        SET r = apoc.map.merge(properties(d), delta)
+    } IN TRANSACTIONS OF 1000 ROWS
+"""
+
+# Vulnerability roll for a pod p, read off its name's random "-NNNN-xxDD" suffix (uniform over
+# its 9000 x 90 values) so re-running the pass reproduces the same demo state; pods without
+# that suffix fall back to rand()
+POD_NAME_ROLL = """coalesce(
+        ((toInteger(split(p.name, '-')[-2]) - 1000) * 90 + toInteger(right(p.name, 2)) - 10) / 810000.0,
+        rand()
+    )"""
+
+# Each pod takes the first of $tiers its roll falls under
+POD_VULNERABILITY_QUERY = """
+    MATCH (p:Pod)
+    WITH p, %s AS roll
+    WITH p, [t IN $tiers WHERE roll < t.upto][0] AS tier
+    CALL {
+        WITH p, tier
+        SET p.security_status = tier.status,
+            p.vulnerabilities_json = tier.vulnerabilities_json,
+            p.compliance_status = tier.compliance_status,
+            p.last_scan = $scanned_at
+    } IN TRANSACTIONS OF 10000 ROWS
+""" % POD_NAME_ROLL
+
+# EC2 instances are also streamed as positional rows; EC2_FIELDS fixes the column order
+EC2_FIELDS = (
+    "instance_id", "name", "instance_type", "region", "vpc_id", "availability_zone",
+    "status", "private_ip", "public_ip", "subnet_id", "security_groups",
+    "key_pair", "iam_role", "purpose", "os_type", "ami_id", "cost_monthly",
+    "cpu_utilization", "memory_utilization", "disk_utilization", "environment",
+    "business_unit", "patch_group", "monitoring_enabled", "created_at",
+    "ebs_volumes_json", "sqlserver_edition", "sqlserver_version", "license_type", "collation"
+)
+
+EC2_INSERT_QUERY = """
+    UNWIND $rows as inst
+    CALL {
+        WITH inst
+        CREATE (e:EC2Instance:AWSResource {%s, type: 'EC2'})
+    } IN TRANSACTIONS OF 1000 ROWS
+""" % ", ".join(f"{field}: inst[{i}]" for i, field in enumerate(EC2_FIELDS))
+
+LAMBDA_INSERT_QUERY = """
+    UNWIND $rows as func
+    CALL {
+        WITH func
+        CREATE (f:LambdaFunction:AWSResource {
+            name: func.name, arn: func.arn, type: func.type, runtime: func.runtime,
+            memory: func.memory, timeout: func.timeout, region: func.region,
+            vpc_id: func.vpc_id, environment: func.environment, business_unit: func.business_unit,
+            invocations_per_day: func.invocations_per_day, avg_duration: func.avg_duration,
+            error_rate: func.error_rate, cost_monthly: func.cost_monthly,
+            last_modified: func.last_modified, concurrent_executions: func.concurrent_executions,
+            dead_letter_queue: func.dead_letter_queue, layers: func.layers
+        })
+    } IN TRANSACTIONS OF 1000 ROWS
+"""
+
+AWS_SERVICE_INSERT_QUERY = """
+    UNWIND $rows as svc
+    CALL {
+        WITH svc
+        CREATE (s:AWSService:AWSResource {
+            name: svc.name, arn: svc.arn, type: svc.type, region: svc.region,
+            environment: svc.environment, business_unit: svc.business_unit,
+            cost_monthly: svc.cost_monthly, created_at: svc.created_at,
+            storage_class: svc.storage_class, object_count: svc.object_count,
+            size_gb: svc.size_gb, versioning: svc.versioning, encryption: svc.encryption,
+            lifecycle_policy: svc.lifecycle_policy, public_access: svc.public_access,
+            replication: svc.replication, purpose: svc.purpose,
+            api_type: svc.api_type, stage: svc.stage, requests_per_day: svc.requests_per_day,
+            avg_latency: svc.avg_latency, error_rate: svc.error_rate,
+            throttling_enabled: svc.throttling_enabled, caching_enabled: svc.caching_enabled,
+            cors_enabled: svc.cors_enabled, custom_domain: svc.custom_domain
+        })
+    } IN TRANSACTIONS OF 1000 ROWS
+"""
+
+# Streamed generators hand rows to the writer in chunks of this size; the bounded
+# queue applies backpressure so at most a few chunks are resident at once
+STREAM_CHUNK_SIZE = 2000
+WRITE_QUEUE_DEPTH = 4
+
+# Insert batches the writer keeps in flight at once, each on its own async session
+WRITER_CONCURRENCY = 4
+
+# Pod, database and AWS service generation runs in worker processes once VPCs and clusters exist
+GENERATOR_WORKERS = 3
+
+class ColumnarRows:
+    """Struct-of-arrays row store: one list per field, rows zipped into tuples only per write batch
+
+    Columns may be longer than the row count (pre-drawn random fields); only the
+    first ``length`` entries of each are used.
+    """
+    
+    def __init__(self, columns: Dict[str, List[Any]], fields: Tuple[str, ...], length: int):
+        self.columns = columns
+        self.fields = fields
+        self.length = length
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def write_csv(self, path: str):
+        """Write a header row of self.fields followed by every row, STREAM_CHUNK_SIZE rows at a time"""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.fields)
+            for batch in self.iter_rows(STREAM_CHUNK_SIZE):
+                writer.writerows(batch)
+    
+    def iter_rows(self, batch_size: int) -> Iterator[List[Tuple[Any, ...]]]:
+        """Yield lists of up to batch_size positional rows, ordered by self.fields"""
+        ordered = [self.columns[field] for field in self.fields]
+        for start in range(0, self.length, batch_size):
+            end = min(start + batch_size, self.length)
+            yield list(zip(*(column[start:end] for column in ordered)))
+
+
 class EnterpriseTopologyGenerator:
-    """Generates enterprise-scale infrastructure topology with 50,000+ nodes"""
+    """Generates enterprise-scale infrastructure topology with 50,000+ nodes
+
+    Neo4j node writes go through a single consumer thread: generation may overlap
+    with loading, and the consumer pipelines up to WRITER_CONCURRENCY insert
+    batches over the async driver. Every batch only CREATEs fresh nodes, so they
+    don't contend on locks; relationships are built afterwards on one session.
+    """
+    
+    # Monthly cost lookups, keyed by instance type / RDS size
+    _COST_PER_NODE = {
+        "t3.medium": 35, "t3.large": 70, "m5.large": 90, "m5.xlarge": 180,
+        "m5.2xlarge": 360, "m5.4xlarge": 720, "c5.xlarge": 160, "c5.2xlarge": 320,
+        "c5.4xlarge": 640, "r5.2xlarge": 480, "r5.4xlarge": 960
+    }
+    
+    _DB_BASE_COSTS = {
+        "small": 120, "medium": 350, "large": 800, "xlarge": 1500
+    }
+    
+    # EC2 instance purposes in financial services
+    _EC2_PURPOSES = (
+        {"type": "web-server", "count_ratio": 0.25, "sizes": ["small", "medium"]},
+        {"type": "application-server", "count_ratio": 0.30, "sizes": ["medium", "large"]},
+        {"type": "batch-processor", "count_ratio": 0.15, "sizes": ["large", "xlarge"]},
+        {"type": "cache-server", "count_ratio": 0.10, "sizes": ["medium", "large"]},
+        {"type": "monitoring-agent", "count_ratio": 0.08, "sizes": ["small"]},
+        {"type": "security-scanner", "count_ratio": 0.05, "sizes": ["medium"]},
+        {"type": "backup-server", "count_ratio": 0.04, "sizes": ["large"]},
+        {"type": "jump-host", "count_ratio": 0.02, "sizes": ["small"]},
+        {"type": "sql-server", "count_ratio": 0.01, "sizes": ["large", "xlarge"]}
+    )
+    
+    _SQLSERVER_EDITIONS = ("Enterprise", "Standard", "Web", "Express")
+    _SQLSERVER_VERSIONS = ("2019", "2017", "2016")
+    _SQLSERVER_LICENSE_TYPES = ("license-included", "bring-your-own-license")
+    
+    _EKS_ADDONS = ("vpc-cni", "kube-proxy", "coredns", "aws-ebs-csi-driver", "aws-efs-csi-driver")
+    
+    # Pod vulnerability tiers, first match wins. Cumulative roll thresholds keep the sequential
+    # odds: 2% critical, then 8% of the rest high, then 15% of the rest medium, the rest clean.
+    # CVE lists are pre-serialized because Neo4j properties can't hold maps.
+    _VULNERABILITY_TIERS = (
+        {"upto": 0.02, "status": "critical", "compliance_status": "non_compliant", "vulnerabilities_json": orjson.dumps([
+            {"cve": "CVE-2024-3094", "severity": "CRITICAL", "score": 10.0, "description": "Remote code execution in XZ Utils"},
+            {"cve": "CVE-2024-6387", "severity": "HIGH", "score": 8.1, "description": "SSH vulnerability allowing privilege escalation"}
+        ]).decode()},
+        {"upto": 0.0984, "status": "high", "compliance_status": "review_required", "vulnerabilities_json": orjson.dumps([
+            {"cve": "CVE-2024-22195", "severity": "HIGH", "score": 7.5, "description": "Jinja2 template injection vulnerability"},
+            {"cve": "CVE-2024-35195", "severity": "MEDIUM", "score": 6.2, "description": "Information disclosure in HTTP headers"}
+        ]).decode()},
+        {"upto": 0.23364, "status": "medium", "compliance_status": "compliant", "vulnerabilities_json": orjson.dumps([
+            {"cve": "CVE-2024-12345", "severity": "MEDIUM", "score": 5.3, "description": "Outdated dependency with known issues"}
+        ]).decode()},
+        {"upto": 1.0, "status": "clean", "compliance_status": "compliant", "vulnerabilities_json": "[]"}
+    )
+    
+    _EC2_COST_PER_INSTANCE = {
+        "t3.micro": 8, "t3.small": 16, "t3.medium": 35, "t3.large": 70,
+        "m5.large": 90, "m5.xlarge": 180, "m5.2xlarge": 360, "m5.4xlarge": 720,
+        "c5.large": 80, "c5.xlarge": 160, "c5.2xlarge": 320, "c5.4xlarge": 640,
+        "m5.8xlarge": 1440, "c5.9xlarge": 1440, "c5.18xlarge": 2880
+    }
     
     def __init__(self, neo4j_uri: str = "bolt://graph:7687", auth: tuple = ("neo4j", "ubiquitous123")):
-        self.driver = GraphDatabase.driver(neo4j_uri, auth=auth)
+        # neo4j_uri=None builds a generation-only instance (used by worker processes)
+        self.driver = GraphDatabase.driver(
+            neo4j_uri, auth=auth, max_connection_pool_size=50, connection_acquisition_timeout=60
+        ) if neo4j_uri else None
+        self._neo4j_uri = neo4j_uri
+        self._auth = auth
+        self._rng = np.random.default_rng()
         
         # Capital Group specific organizational structure
-        self.business_units = [
+        # Categorical values are interned so every generated row shares one str object
+        self.business_units = [sys.intern(bu) for bu in [
             "Trading", "Risk", "Portfolio", "Compliance", "Client-Services", 
             "Market-Data", "Settlement", "Operations", "Analytics", "Research"
-        ]
+        ]]
         
-        self.environments = ["prod", "staging", "qa", "dev", "sandbox", "perf"]
+        self.environments = [sys.intern(env) for env in ["prod", "staging", "qa", "dev", "sandbox", "perf"]]
         
         # AWS regions with realistic distribution
         self.regions = {
@@ -82,6 +383,167 @@ class EnterpriseTopologyGenerator:
             {"prefix": "compliance", "services": ["aml-scanner", "kyc-validator", "trade-surveillance", "reporting-engine", "audit-trail"]},
             {"prefix": "ops", "services": ["monitoring", "alerting", "logging", "metrics-collector", "incident-manager"]}
         ]
+        
+        # Weighted categorical distributions, normalized once for batched rng.choice draws
+        self._region_vals, self._region_p = self._weighted({region: data["weight"] for region, data in self.regions.items()})
+        self._eks_version_vals, self._eks_version_p = self._weighted({"1.27": 10, "1.28": 30, "1.29": 50, "1.30": 10})
+        self._cluster_status_vals, self._cluster_status_p = self._weighted(
+            {"ACTIVE": 85, "CREATING": 8, "UPDATING": 6, "DELETING": 1})
+        self._pod_status_vals, self._pod_status_p = self._weighted(
+            {"Running": 85, "Pending": 5, "Succeeded": 5, "Failed": 3, "Unknown": 2})
+        self._pod_phase_vals, self._pod_phase_p = self._weighted({"Running": 85, "Pending": 8, "Succeeded": 4, "Failed": 3})
+        self._restart_count_vals, self._restart_count_p = self._weighted({0: 60, 1: 20, 2: 10, 3: 5, 4: 3, 5: 2})
+        self._db_status_vals, self._db_status_p = self._weighted(
+            {"available": 82, "backing-up": 8, "modifying": 5, "upgrading": 3, "rebooting": 2})
+        self._storage_type_vals, self._storage_type_p = self._weighted({"gp3": 60, "gp2": 25, "io1": 10, "io2": 5})
+        self._ec2_status_vals, self._ec2_status_p = self._weighted(
+            {"running": 75, "stopped": 15, "pending": 5, "stopping": 3, "terminated": 2})
+        self._ec2_os_vals, self._ec2_os_p = self._weighted(
+            {"Amazon Linux 2": 40, "Ubuntu 22.04": 30, "RHEL 8": 20, "Windows Server 2019": 10})
+        self._alb_state_vals, self._alb_state_p = self._weighted({"active": 90, "provisioning": 8, "failed": 2})
+
+    @staticmethod
+    def _weighted(weights: Dict[Any, int]) -> Tuple[List[Any], np.ndarray]:
+        """Split a value -> weight map into choice values and normalized probabilities"""
+        values = [sys.intern(v) if isinstance(v, str) else v for v in weights]
+        probs = np.array(list(weights.values()), dtype=float)
+        return values, probs / probs.sum()
+
+    def _draw(self, values: List[Any], probs: Optional[np.ndarray], n: int) -> List[Any]:
+        """Draw n choices (uniform when probs is None) as references into values
+        
+        Indexes are drawn rather than values so results share the original objects
+        instead of fresh per-row str copies from the numpy string array.
+        """
+        return [values[i] for i in self._rng.choice(len(values), n, p=probs).tolist()]
+
+    @staticmethod
+    def _serialize_nested(rows: List[Dict[str, Any]], *fields: str):
+        """Replace nested map/list-of-map fields with *_json strings (Neo4j properties must be primitives)"""
+        for row in rows:
+            for field in fields:
+                if field in row:
+                    row[f"{field}_json"] = orjson.dumps(row.pop(field)).decode()
+
+    @staticmethod
+    def _write_batches(label: str, rows, batch_size: int = 15000) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Split one queued write into (log label, query parameters) pairs, one request per batch
+        
+        rows is a list of dicts or positional tuples, ColumnarRows, or None for a self-contained load.
+        """
+        if rows is None:
+            # Self-contained load (e.g. LOAD CSV); nothing to pass as $rows
+            yield f"{label} nodes", {}
+            return
+        
+        total_batches = (len(rows) + batch_size - 1) // batch_size
+        if isinstance(rows, ColumnarRows):
+            batches = rows.iter_rows(batch_size)
+        else:
+            batches = (rows[i:i + batch_size] for i in range(0, len(rows), batch_size))
+        
+        for batch_num, batch in enumerate(batches, 1):
+            yield f"{label} batch {batch_num}/{total_batches}", {"rows": batch}
+
+    @staticmethod
+    async def _write_batch(driver, slots: asyncio.Semaphore, label: str, query: str, params: Dict[str, Any]):
+        """Run one insert request on its own session, then free its in-flight slot"""
+        try:
+            async with driver.session() as session:
+                # Auto-commit run: CALL { } IN TRANSACTIONS can't execute inside a managed transaction
+                result = await session.run(query, params)
+                await result.consume()
+            logger.info(f"Created {label}")
+        finally:
+            slots.release()
+
+    @staticmethod
+    def _isoformat_ago(now: np.datetime64, days: np.ndarray, hours: Optional[np.ndarray] = None) -> List[str]:
+        """ISO timestamps now - days (- hours), formatted in one vectorized pass"""
+        stamps = now - days.astype("timedelta64[D]")
+        if hours is not None:
+            stamps = stamps - hours.astype("timedelta64[h]")
+        return stamps.astype(str).tolist()
+
+    def _random_hex(self, n: int, digits: int) -> List[str]:
+        """Draw n random lowercase hex ids of the given length from one rng.bytes call"""
+        width = 2 * ((digits + 1) // 2)
+        data = self._rng.bytes(n * width // 2).hex()
+        return [data[i:i + digits] for i in range(0, n * width, width)]
+
+    def _random_uuids(self, n: int) -> List[str]:
+        """Draw n version-4 UUID strings from one rng.bytes call instead of a urandom read each"""
+        data = self._rng.bytes(16 * n)
+        return [str(uuid.UUID(bytes=data[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+    def _random_ips(self, n: int, first_low: int, first_high: int, sep: str = ".") -> List[str]:
+        """Draw n IPv4 addresses (first octet in [first_low, first_high]) formatted in one pass"""
+        rng = self._rng
+        octets = np.column_stack((
+            rng.integers(first_low, first_high + 1, n),
+            rng.integers(0, 256, (n, 2)),
+            rng.integers(1, 255, n)
+        )).tolist()
+        fmt = sep.join(["{}"] * 4).format
+        return [fmt(*row) for row in octets]
+
+    def _stream_to_writer(self, write_queue: queue.Queue, label: str, query: str,
+                          rows: Iterator[Any], *nested_fields: str) -> int:
+        """Feed streamed rows (dicts or positional tuples) to the writer in STREAM_CHUNK_SIZE chunks; returns the row count
+        
+        nested_fields only applies to dict rows; positional generators serialize their own.
+        """
+        count = 0
+        for chunk in iter(lambda: list(itertools.islice(rows, STREAM_CHUNK_SIZE)), []):
+            self._serialize_nested(chunk, *nested_fields)
+            write_queue.put((label, query, chunk))
+            count += len(chunk)
+        return count
+
+    def _drain_write_queue(self, write_queue: queue.Queue, errors: List[Exception]):
+        """Writer thread entry point: runs the async consumer on this thread's own event loop"""
+        try:
+            asyncio.run(self._drain_write_queue_async(write_queue, errors))
+        except Exception as e:
+            errors.append(e)
+
+    async def _drain_write_queue_async(self, write_queue: queue.Queue, errors: List[Exception]):
+        """Single consumer for node writes, keeping up to WRITER_CONCURRENCY batches in flight"""
+        driver = None
+        slots = asyncio.Semaphore(WRITER_CONCURRENCY)
+        in_flight = set()
+        try:
+            while True:
+                item = await asyncio.to_thread(write_queue.get)
+                if item is None:
+                    return
+                if errors:
+                    # Keep draining so the producer's final sentinel is consumed
+                    continue
+                
+                try:
+                    if driver is None:
+                        driver = AsyncGraphDatabase.driver(self._neo4j_uri, auth=self._auth)
+                    label, query, rows = item
+                    for batch_label, params in self._write_batches(label, rows):
+                        await slots.acquire()
+                        for task in [t for t in in_flight if t.done()]:
+                            in_flight.discard(task)
+                            if task.exception():
+                                errors.append(task.exception())
+                        if errors:
+                            slots.release()
+                            break
+                        in_flight.add(asyncio.create_task(
+                            self._write_batch(driver, slots, batch_label, query, params)
+                        ))
+                except Exception as e:
+                    errors.append(e)
+        finally:
+            results = await asyncio.gather(*in_flight, return_exceptions=True)
+            errors.extend(r for r in results if isinstance(r, Exception))
+            if driver is not None:
+                await driver.close()
 
     def clear_existing_data(self):
         """Clear existing infrastructure data"""
@@ -122,21 +584,32 @@ class EnterpriseTopologyGenerator:
                 "CREATE INDEX app_environment IF NOT EXISTS FOR (a:Application) ON (a.environment)",
                 "CREATE INDEX app_criticality IF NOT EXISTS FOR (a:Application) ON (a.business_criticality)",
                 "CREATE INDEX pod_status IF NOT EXISTS FOR (p:Pod) ON (p.status)",
-                "CREATE INDEX pod_namespace IF NOT EXISTS FOR (p:Pod) ON (p.namespace)"
+                "CREATE INDEX pod_namespace IF NOT EXISTS FOR (p:Pod) ON (p.namespace)",
+                "CREATE INDEX pod_environment IF NOT EXISTS FOR (p:Pod) ON (p.environment)",
+                # Join keys for the relationship pass, so its MATCHes seek instead of scanning
+                "CREATE INDEX cluster_vpc IF NOT EXISTS FOR (c:EKSCluster) ON (c.vpc_id)",
+                "CREATE INDEX db_vpc IF NOT EXISTS FOR (d:RDSInstance) ON (d.vpc_id)",
+                "CREATE INDEX ec2_vpc IF NOT EXISTS FOR (e:EC2Instance) ON (e.vpc_id)",
+                "CREATE INDEX pod_cluster IF NOT EXISTS FOR (p:Pod) ON (p.cluster_name)",
+                "CREATE INDEX pod_business_unit IF NOT EXISTS FOR (p:Pod) ON (p.business_unit)",
+                # Seek keys for the cost-optimization marking passes
+                "CREATE INDEX ec2_instance_type IF NOT EXISTS FOR (e:EC2Instance) ON (e.instance_type)",
+                "CREATE INDEX ec2_environment IF NOT EXISTS FOR (e:EC2Instance) ON (e.environment)",
+                "CREATE INDEX optimization_savings IF NOT EXISTS FOR (n:CostOptimizationCandidate) ON (n.potential_monthly_savings)",
+                # Text index: serves the CONTAINS matches in the service dependency pass
+                "CREATE TEXT INDEX pod_service_name_text IF NOT EXISTS FOR (p:Pod) ON (p.service_name)"
             ]
             
-            for constraint in constraints:
+            # Each statement commits on its own, so one conflicting definition (IF NOT EXISTS does not
+            # cover e.g. a constraint blocked by an existing index on the same property) only loses itself
+            for statement in constraints + indexes:
                 try:
-                    session.run(constraint)
+                    session.run(statement).consume()
                 except Exception as e:
-                    logger.debug(f"Constraint might already exist: {e}")
-            
-            for index in indexes:
-                try:
-                    session.run(index)
-                except Exception as e:
-                    logger.debug(f"Index might already exist: {e}")
+                    logger.warning("Schema statement failed: %s: %s", statement, e)
             
+            # Indexes are created empty before the load, so this returns as soon as they are online
+            session.run("CALL db.awaitIndexes(300)").consume()
             logger.info("✅ Enhanced constraints and indexes created")
 
     def generate_enterprise_vpcs(self, count: int = 15) -> List[Dict[str, Any]]:
@@ -168,16 +641,19 @@ class EnterpriseTopologyGenerator:
         
         all_vpc_templates = prod_vpcs + non_prod_vpcs
         
+        # Weighted region selection
+        regions = self._draw(self._region_vals, self._region_p, len(all_vpc_templates[:count]))
+        vpc_nums = self._rng.integers(10000000, 100000000, len(regions)).tolist()
+        tag_business_units = self._draw(self.business_units, None, len(regions))
+        now = datetime.utcnow()
+        
         for i, template in enumerate(all_vpc_templates[:count]):
-            # Weighted region selection
-            region_weights = [(region, data["weight"]) for region, data in self.regions.items()]
-            regions, weights = zip(*region_weights)
-            region = random.choices(regions, weights=weights)[0]
+            region = regions[i]
             
             environment = "production" if "prod" in template["name"] else template["name"].split("-")[0]
             
             vpc = {
-                "vpc_id": f"vpc-{random.randint(10000000, 99999999):08x}",
+                "vpc_id": f"vpc-{vpc_nums[i]:08x}",
                 "name": template["name"],
                 "cidr_block": template["cidr"],
                 "region": region,
@@ -186,10 +662,10 @@ class EnterpriseTopologyGenerator:
                 "business_criticality": template["criticality"],
                 "dns_hostnames": True,
                 "dns_resolution": True,
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(180, 800))).isoformat(),
+                "created_at": (now - timedelta(days=random.randint(180, 800))).isoformat(),
                 "tags": {
                     "Environment": environment,
-                    "BusinessUnit": random.choice(self.business_units),
+                    "BusinessUnit": tag_business_units[i],
                     "CostCenter": f"CC-{random.randint(1000, 9999)}",
                     "Owner": f"{random.choice(['trading', 'risk', 'portfolio', 'ops'])}-team@capitalgroup.com"
                 }
@@ -209,8 +685,27 @@ class EnterpriseTopologyGenerator:
                 if env == "prod" or random.random() < 0.7:  # Not all BUs have all environments
                     cluster_patterns.append(f"{env}-{bu.lower()}-cluster")
         
-        for i, cluster_name in enumerate(cluster_patterns[:count]):
-            vpc = random.choice([v for v in vpcs if cluster_name.startswith(v["environment"])])
+        cluster_names = cluster_patterns[:count]
+        versions = self._draw(self._eks_version_vals, self._eks_version_p, len(cluster_names))
+        statuses = self._draw(self._cluster_status_vals, self._cluster_status_p, len(cluster_names))
+        endpoint_ids = self._random_hex(len(cluster_names), 12)
+        # Drawn at the maximum list length; each cluster keeps a random-length prefix
+        rng = self._rng
+        k = len(cluster_names)
+        subnet_nums = rng.integers(10000, 100000, (k, 8)).tolist()
+        subnet_counts = rng.integers(4, 9, k).tolist()
+        sg_nums = rng.integers(10000000, 100000000, (k, 4)).tolist()
+        sg_counts = rng.integers(2, 5, k).tolist()
+        # Argsort of uniform draws gives one random addon permutation per cluster
+        addon_orders = rng.random((k, len(self._EKS_ADDONS))).argsort(axis=1).tolist()
+        addon_counts = rng.integers(3, len(self._EKS_ADDONS) + 1, k).tolist()
+        
+        vpcs_by_env = vpcs_by_environment(vpcs)
+        now = datetime.utcnow()
+        
+        for i, cluster_name in enumerate(cluster_names):
+            cluster_env = cluster_name.split("-")[0]
+            vpc = random.choice(vpcs_by_env["production" if cluster_env == "prod" else cluster_env])
             
             # Realistic node group configuration
             if "prod" in cluster_name:
@@ -230,11 +725,7 @@ class EnterpriseTopologyGenerator:
             instance_type = random.choice(self.instance_types["eks_nodes"][random.choice(instance_sizes)])
             
             # Calculate realistic costs
-            cost_per_node = {
-                "t3.medium": 35, "t3.large": 70, "m5.large": 90, "m5.xlarge": 180,
-                "m5.2xlarge": 360, "m5.4xlarge": 720, "c5.xlarge": 160, "c5.2xlarge": 320,
-                "c5.4xlarge": 640, "r5.2xlarge": 480, "r5.4xlarge": 960
-            }.get(instance_type, 100)
+            cost_per_node = self._COST_PER_NODE.get(instance_type, 100)
             
             monthly_cost = total_nodes * cost_per_node
             
@@ -243,18 +734,18 @@ class EnterpriseTopologyGenerator:
                 "arn": f"arn:aws:eks:{vpc['region']}:123456789012:cluster/{cluster_name}",
                 "region": vpc["region"],
                 "vpc_id": vpc["vpc_id"],
-                "version": random.choices(["1.27", "1.28", "1.29", "1.30"], weights=[10, 30, 50, 10])[0],
-                "status": random.choices(["ACTIVE", "CREATING", "UPDATING", "DELETING"], weights=[85, 8, 6, 1])[0],
-                "endpoint": f"https://{uuid.uuid4().hex[:12].upper()}.yl4.{vpc['region']}.eks.amazonaws.com",
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(60, 400))).isoformat(),
+                "version": versions[i],
+                "status": statuses[i],
+                "endpoint": f"https://{endpoint_ids[i].upper()}.yl4.{vpc['region']}.eks.amazonaws.com",
+                "created_at": (now - timedelta(days=random.randint(60, 400))).isoformat(),
                 "node_groups": node_groups,
                 "total_nodes": total_nodes,
                 "primary_instance_type": instance_type,
                 "cost_monthly": monthly_cost,
                 "environment": vpc["environment"],
-                "business_unit": cluster_name.split("-")[1].title(),
-                "subnet_ids": [f"subnet-{random.randint(10000, 99999):05x}" for _ in range(random.randint(4, 8))],
-                "security_groups": [f"sg-eks-{random.randint(10000000, 99999999):08x}" for _ in range(random.randint(2, 4))],
+                "business_unit": sys.intern(cluster_name.split("-")[1].title()),
+                "subnet_ids": [f"subnet-{num:05x}" for num in subnet_nums[i][:subnet_counts[i]]],
+                "security_groups": [f"sg-eks-{num:08x}" for num in sg_nums[i][:sg_counts[i]]],
                 "logging": {
                     "api": random.choice([True, False]),
                     "audit": True if "prod" in cluster_name else random.choice([True, False]),
@@ -262,16 +753,17 @@ class EnterpriseTopologyGenerator:
                     "controllerManager": True if "prod" in cluster_name else random.choice([True, False]),
                     "scheduler": True if "prod" in cluster_name else random.choice([True, False])
                 },
-                "addons": random.sample(["vpc-cni", "kube-proxy", "coredns", "aws-ebs-csi-driver", "aws-efs-csi-driver"], random.randint(3, 5))
+                "addons": [self._EKS_ADDONS[j] for j in addon_orders[i][:addon_counts[i]]]
             }
             clusters.append(cluster)
             
         return clusters
 
-    def generate_massive_pod_topology(self, clusters: List[Dict], target_pods: int = 15000) -> List[Dict[str, Any]]:
-        """Generate 15,000+ Kubernetes pods across clusters"""
-        pods = []
+    def generate_massive_pod_topology(self, clusters: List[Dict], target_pods: int = 15000) -> ColumnarRows:
+        """Generate 15,000+ Kubernetes pods across clusters (as columns; labels pre-serialized to labels_json)"""
         pods_generated = 0
+        rng = self._rng
+        n = target_pods
         
         # Create namespaces first
         namespaces = []
@@ -283,9 +775,49 @@ class EnterpriseTopologyGenerator:
                     f"{bu.lower()}-{env}-monitoring"
                 ])
         
+        # Draw every per-pod random field up front in vectorized batches
+        name_suffixes = [
+            f"-{num}-{a}{b}{digits}" for num, (a, b), digits in zip(
+                rng.integers(1000, 10000, n).tolist(),
+                rng.choice(list(string.ascii_lowercase), (n, 2)).tolist(),
+                rng.integers(10, 100, n).tolist()
+            )
+        ]
+        statuses = self._draw(self._pod_status_vals, self._pod_status_p, n)
+        phases = self._draw(self._pod_phase_vals, self._pod_phase_p, n)
+        node_ips = self._random_ips(n, 10, 192, sep="-")
+        pod_ips = self._random_ips(n, 10, 192)
+        host_ips = self._random_ips(n, 10, 192)
+        start_times = self._isoformat_ago(
+            np.datetime64(datetime.utcnow(), "us"), rng.integers(1, 31, n), rng.integers(0, 24, n)
+        )
+        restart_counts = self._draw(self._restart_count_vals, self._restart_count_p, n)
+        tech_stacks = self._draw([sys.intern(stack) for stack in self.technology_stacks], None, n)
+        language_picks = rng.random(n).tolist()
+        framework_picks = rng.random(n).tolist()
+        image_tags = [
+            f"{major}.{minor}.{patch}" for major, minor, patch in zip(
+                rng.integers(1, 6, n).tolist(), rng.integers(0, 21, n).tolist(), rng.integers(0, 51, n).tolist()
+            )
+        ]
+        container_ports = rng.choice([8080, 8000, 9000, 3000, 4000, 8443], n).tolist()
+        liveness_probes = (rng.random(n) < 0.5).tolist()
+        volumes = rng.integers(0, 4, n).tolist()
+        label_versions = [
+            f"v{major}.{minor}" for major, minor in zip(rng.integers(1, 6, n).tolist(), rng.integers(0, 21, n).tolist())
+        ]
+        tiers = self._draw(["frontend", "backend", "database", "cache"], None, n)
+        
+        # Per-pod columns filled by the loop below; pre-drawn fields are used as columns directly
+        names, namespaces_col, cluster_names, service_names = [], [], [], []
+        business_units, environments, node_names = [], [], []
+        cpu_requests, cpu_limits, memory_requests, memory_limits = [], [], [], []
+        pod_languages, pod_frameworks, container_images, labels_json = [], [], [], []
+        
         # Generate pods distributed across clusters
+        total_all_nodes = sum(c["total_nodes"] for c in clusters)
         for cluster in clusters:
-            cluster_pod_count = int(target_pods * (cluster["total_nodes"] / sum(c["total_nodes"] for c in clusters)))
+            cluster_pod_count = int(target_pods * (cluster["total_nodes"] / total_all_nodes))
             cluster_pods_created = 0
             
             while cluster_pods_created < cluster_pod_count and pods_generated < target_pods:
@@ -302,12 +834,15 @@ class EnterpriseTopologyGenerator:
                 for replica in range(replicas):
                     if pods_generated >= target_pods:
                         break
-                        
-                    pod_name = f"{service_name}-{random.randint(1000, 9999)}-{random.choice(string.ascii_lowercase)}{random.choice(string.ascii_lowercase)}{random.randint(10, 99)}"
+                    
+                    i = pods_generated
+                    pod_name = service_name + name_suffixes[i]
                     
                     # Select technology stack
-                    tech_stack = random.choice(list(self.technology_stacks.keys()))
+                    tech_stack = tech_stacks[i]
                     stack_info = self.technology_stacks[tech_stack]
+                    languages = stack_info["languages"]
+                    frameworks = stack_info["frameworks"]
                     
                     # Resource allocation based on service type
                     if "engine" in service_name or "calculator" in service_name:
@@ -320,51 +855,63 @@ class EnterpriseTopologyGenerator:
                         cpu_request, cpu_limit = "100m", "500m"
                         memory_request, memory_limit = "256Mi", "1Gi"
                     
-                    pod = {
-                        "name": pod_name,
-                        "namespace": namespace,
-                        "cluster_name": cluster["name"],
-                        "status": random.choices(["Running", "Pending", "Succeeded", "Failed", "Unknown"], 
-                                               weights=[85, 5, 5, 3, 2])[0],
-                        "phase": random.choices(["Running", "Pending", "Succeeded", "Failed"], 
-                                              weights=[85, 8, 4, 3])[0],
-                        "service_name": service_name,
-                        "business_unit": cluster["business_unit"],
-                        "environment": cluster["environment"],
-                        "node_name": f"ip-{random.randint(10,192)}-{random.randint(0,255)}-{random.randint(0,255)}-{random.randint(1,254)}.{cluster['region']}.compute.internal",
-                        "pod_ip": f"{random.randint(10,192)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}",
-                        "host_ip": f"{random.randint(10,192)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}",
-                        "start_time": (datetime.utcnow() - timedelta(days=random.randint(1, 30), hours=random.randint(0, 23))).isoformat(),
-                        "restart_count": random.choices([0, 1, 2, 3, 4, 5], weights=[60, 20, 10, 5, 3, 2])[0],
-                        "cpu_request": cpu_request,
-                        "cpu_limit": cpu_limit,
-                        "memory_request": memory_request,
-                        "memory_limit": memory_limit,
-                        "technology_stack": tech_stack,
-                        "language": random.choice(stack_info["languages"]),
-                        "framework": random.choice(stack_info["frameworks"]),
-                        "container_image": f"capital-registry.com/{service_name}:{random.randint(1,5)}.{random.randint(0,20)}.{random.randint(0,50)}",
-                        "container_port": random.choice([8080, 8000, 9000, 3000, 4000, 8443]),
-                        "liveness_probe": random.choice([True, False]),
-                        "readiness_probe": True,
-                        "volumes": random.randint(0, 3),
-                        "labels": {
-                            "app": service_name,
-                            "version": f"v{random.randint(1,5)}.{random.randint(0,20)}",
-                            "tier": random.choice(["frontend", "backend", "database", "cache"]),
-                            "business-unit": cluster["business_unit"].lower()
-                        }
-                    }
-                    pods.append(pod)
+                    names.append(pod_name)
+                    namespaces_col.append(namespace)
+                    cluster_names.append(cluster["name"])
+                    service_names.append(service_name)
+                    business_units.append(cluster["business_unit"])
+                    environments.append(cluster["environment"])
+                    node_names.append(f"ip-{node_ips[i]}.{cluster['region']}.compute.internal")
+                    cpu_requests.append(cpu_request)
+                    cpu_limits.append(cpu_limit)
+                    memory_requests.append(memory_request)
+                    memory_limits.append(memory_limit)
+                    pod_languages.append(languages[int(language_picks[i] * len(languages))])
+                    pod_frameworks.append(frameworks[int(framework_picks[i] * len(frameworks))])
+                    container_images.append(f"capital-registry.com/{service_name}:{image_tags[i]}")
+                    labels_json.append(orjson.dumps({
+                        "app": service_name,
+                        "version": label_versions[i],
+                        "tier": tiers[i],
+                        "business-unit": cluster["business_unit"].lower()
+                    }).decode())
                     pods_generated += 1
                     cluster_pods_created += 1
         
         logger.info(f"✅ Generated {pods_generated} pods across {len(clusters)} clusters")
-        return pods
+        return ColumnarRows({
+            "name": names,
+            "namespace": namespaces_col,
+            "cluster_name": cluster_names,
+            "status": statuses,
+            "phase": phases,
+            "service_name": service_names,
+            "business_unit": business_units,
+            "environment": environments,
+            "node_name": node_names,
+            "pod_ip": pod_ips,
+            "host_ip": host_ips,
+            "start_time": start_times,
+            "restart_count": restart_counts,
+            "cpu_request": cpu_requests,
+            "cpu_limit": cpu_limits,
+            "memory_request": memory_requests,
+            "memory_limit": memory_limits,
+            "technology_stack": tech_stacks,
+            "language": pod_languages,
+            "framework": pod_frameworks,
+            "container_image": container_images,
+            "container_port": container_ports,
+            "liveness_probe": liveness_probes,
+            "readiness_probe": [True] * pods_generated,
+            "volumes": volumes,
+            "labels_json": labels_json
+        }, POD_FIELDS, pods_generated)
 
     def generate_enterprise_databases(self, vpcs: List[Dict], count: int = 50) -> List[Dict[str, Any]]:
-        """Generate 50 database instances across environments"""
+        """Generate 50 database instances across environments (read replicas as per-primary deltas)"""
         databases = []
+        instance_count = 0
         
         # PostgreSQL templates for different use cases
         pg_templates = [
@@ -394,22 +941,26 @@ class EnterpriseTopologyGenerator:
         
         all_templates = pg_templates * 4 + oracle_templates * 2 + mysql_templates * 3  # Repeat to reach 50
         
-        for i, template in enumerate(all_templates[:count]):
-            vpc = random.choice([v for v in vpcs if v["environment"] == ("production" if "prod" in template["purpose"] or "legacy" in template["purpose"] else random.choice(["staging", "dev"]))])
+        templates = all_templates[:count]
+        db_statuses = self._draw(self._db_status_vals, self._db_status_p, len(templates))
+        storage_types = self._draw(self._storage_type_vals, self._storage_type_p, len(templates))
+        db_business_units = self._draw(self.business_units, None, len(templates))
+        
+        vpcs_by_env = vpcs_by_environment(vpcs)
+        now = datetime.utcnow()
+        
+        for i, template in enumerate(templates):
+            if "prod" in template["purpose"] or "legacy" in template["purpose"]:
+                db_env = "production"
+            else:
+                db_env = random.choice(["staging", "dev"])
+            vpc = random.choice(vpcs_by_env[db_env])
             
             # Instance class selection
-            size_mapping = {
-                "small": random.choice(self.instance_types["rds"]["small"]),
-                "medium": random.choice(self.instance_types["rds"]["medium"]),
-                "large": random.choice(self.instance_types["rds"]["large"]),
-                "xlarge": random.choice(self.instance_types["rds"]["xlarge"])
-            }
-            instance_class = size_mapping[template["size"]]
+            instance_class = random.choice(self.instance_types["rds"][template["size"]])
             
             # Cost calculation
-            base_costs = {
-                "small": 120, "medium": 350, "large": 800, "xlarge": 1500
-            }
+            base_costs = self._DB_BASE_COSTS
             storage_cost = template["storage"] * 0.115
             
             if template["engine"] == "oracle-ee":
@@ -433,22 +984,21 @@ class EnterpriseTopologyGenerator:
                 "engine": template["engine"],
                 "engine_version": template["version"],
                 "instance_class": instance_class,
-                "status": random.choices(["available", "backing-up", "modifying", "upgrading", "rebooting"], 
-                                       weights=[82, 8, 5, 3, 2])[0],
+                "status": db_statuses[i],
                 "region": vpc["region"],
                 "vpc_id": vpc["vpc_id"],
                 "allocated_storage": template["storage"],
-                "storage_type": random.choices(["gp3", "gp2", "io1", "io2"], weights=[60, 25, 10, 5])[0],
+                "storage_type": storage_types[i],
                 "multi_az": template["purpose"].startswith(("trading", "risk", "client")) and "prod" in vpc["environment"],
                 "backup_retention": 30 if "prod" in vpc["environment"] else random.choice([7, 14]),
                 "cost_monthly": round(monthly_cost, 2),
                 "environment": vpc["environment"],
-                "business_unit": random.choice(self.business_units),
+                "business_unit": db_business_units[i],
                 "purpose": template["purpose"],
                 "subnet_group": f"{template['purpose'].split('-')[0]}-db-subnet-group",
                 "parameter_group": f"{template['engine']}-{template['size']}-{random.randint(1, 5)}",
                 "option_group": f"{template['engine']}-{template['version'].split('.')[0]}-{random.randint(1, 3)}" if template["engine"] == "oracle-ee" else None,
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(90, 600))).isoformat(),
+                "created_at": (now - timedelta(days=random.randint(90, 600))).isoformat(),
                 "connections_active": random.randint(5, 200),
                 "connections_max": random.randint(200, 1000),
                 "cpu_utilization": random.uniform(10, 85),
@@ -464,13 +1014,11 @@ class EnterpriseTopologyGenerator:
                 database["character_set"] = "AL32UTF8"
                 database["national_character_set"] = "AL16UTF16"
             
-            databases.append(database)
-            
-            # Generate read replicas
+            # Read replicas carry only the fields that differ; the rest is copied from the primary node
+            database["replicas"] = []
             for replica_num in range(template["replica_count"]):
                 replica_name = f"{db_name}-replica-{replica_num + 1:02d}"
-                replica = database.copy()
-                replica.update({
+                database["replicas"].append({
                     "identifier": replica_name,
                     "arn": f"arn:aws:rds:{vpc['region']}:123456789012:db:{replica_name}",
                     "multi_az": False,
@@ -479,117 +1027,132 @@ class EnterpriseTopologyGenerator:
                     "read_replica_source": db_name,
                     "replica_lag": random.uniform(0.1, 5.2)
                 })
-                databases.append(replica)
+            
+            databases.append(database)
+            instance_count += 1 + len(database["replicas"])
         
-        logger.info(f"✅ Generated {len(databases)} database instances")
+        logger.info(f"✅ Generated {instance_count} database instances")
         return databases
 
-    def generate_massive_ec2_fleet(self, vpcs: List[Dict], target_instances: int = 8000) -> List[Dict[str, Any]]:
-        """Generate 8,000+ EC2 instances for enterprise scale"""
-        instances = []
-        
-        # EC2 instance purposes in financial services
-        instance_purposes = [
-            {"type": "web-server", "count_ratio": 0.25, "sizes": ["small", "medium"]},
-            {"type": "application-server", "count_ratio": 0.30, "sizes": ["medium", "large"]},
-            {"type": "batch-processor", "count_ratio": 0.15, "sizes": ["large", "xlarge"]},
-            {"type": "cache-server", "count_ratio": 0.10, "sizes": ["medium", "large"]},
-            {"type": "monitoring-agent", "count_ratio": 0.08, "sizes": ["small"]},
-            {"type": "security-scanner", "count_ratio": 0.05, "sizes": ["medium"]},
-            {"type": "backup-server", "count_ratio": 0.04, "sizes": ["large"]},
-            {"type": "jump-host", "count_ratio": 0.02, "sizes": ["small"]},
-            {"type": "sql-server", "count_ratio": 0.01, "sizes": ["large", "xlarge"]}
-        ]
+    def generate_massive_ec2_fleet(self, vpcs: List[Dict], target_instances: int = 8000) -> Iterator[Tuple[Any, ...]]:
+        """Generate 8,000+ EC2 instances for enterprise scale (yielded one at a time as EC2_FIELDS rows)"""
+        generated = 0
+        rng = self._rng
+        now = np.datetime64(datetime.utcnow(), "us")
+        environments = {vpc["environment"] for vpc in vpcs}
+        # Environment-only strings are shared across every instance rather than rebuilt per row
+        key_pairs = {env: sys.intern(f"capital-{env}-keypair") for env in environments}
         
-        for purpose_config in instance_purposes:
-            purpose = purpose_config["type"]
+        for purpose_config in self._EC2_PURPOSES:
+            purpose = sys.intern(purpose_config["type"])
+            iam_role = sys.intern(f"EC2-{purpose.title()}-Role")
+            patch_groups = {env: sys.intern(f"{purpose}-{env}-patches") for env in environments}
             instance_count = int(target_instances * purpose_config["count_ratio"])
+            n = instance_count
+            
+            # Draw every per-instance random field for this purpose in vectorized batches
+            vpc_indices = rng.integers(0, len(vpcs), n).tolist()
+            sizes = self._draw(purpose_config["sizes"], None, n)
+            type_picks = rng.random(n).tolist()
+            az_picks = rng.random(n).tolist()
+            
+            # Operating system distribution
+            if purpose == "sql-server":
+                os_types = ["Windows Server 2019"] * n
+            else:
+                os_types = self._draw(self._ec2_os_vals, self._ec2_os_p, n)
+            
+            # 64-bit ids as 16 hex digits, sliced from one rng.bytes buffer each
+            amis = self._random_hex(n, 16)
+            instance_ids = self._random_hex(n, 16)
+            volume_ids = self._random_hex(n, 16)
+            storage_costs = rng.integers(20, 201, n)  # EBS storage
+            name_nums = rng.integers(1, 1000, n).tolist()
+            statuses = self._draw(self._ec2_status_vals, self._ec2_status_p, n)
+            private_ips = [
+                f"10.{b}.{c}.{d}" for b, c, d in zip(
+                    rng.integers(10, 31, n).tolist(), rng.integers(1, 255, n).tolist(), rng.integers(10, 251, n).tolist()
+                )
+            ]
+            public_ips = self._random_ips(n, 1, 223)
+            has_public_ip = (rng.random(n) < 0.1).tolist()
+            subnet_nums = rng.integers(10000, 100000, n).tolist()
+            sg_nums = rng.integers(10000000, 100000000, n).tolist()
+            cpu_utilization = rng.uniform(5, 85, n).tolist()
+            memory_utilization = rng.uniform(15, 90, n).tolist()
+            disk_utilization = rng.uniform(20, 80, n).tolist()
+            business_units = self._draw(self.business_units, None, n)
+            monitoring_flips = (rng.random(n) < 0.5).tolist()
+            created_ats = self._isoformat_ago(now, rng.integers(30, 401, n))
+            volume_sizes = rng.choice([50, 100, 200, 500, 1000], n).tolist()
+            volume_types = self._draw(["gp3", "gp2", "io1"], None, n)
+            volume_iops = rng.integers(100, 5001, n).tolist()
+            encryption_flips = (rng.random(n) < 0.5).tolist()
+            
+            instance_types = [
+                options[int(pick * len(options))]
+                for options, pick in zip((self.instance_types["ec2"][size] for size in sizes), type_picks)
+            ]
+            # Monthly cost as one column sum: base price + Windows licensing + EBS storage
+            base_costs = np.fromiter(
+                (self._EC2_COST_PER_INSTANCE.get(t, 100) for t in instance_types), dtype=np.int64, count=n
+            )
+            is_windows = np.fromiter(("Windows" in os_type for os_type in os_types), dtype=bool, count=n)
+            monthly_costs = (base_costs + np.where(is_windows, 50, 0) + storage_costs).tolist()
             
             for i in range(instance_count):
-                vpc = random.choice(vpcs)
-                size = random.choice(purpose_config["sizes"])
-                instance_type = random.choice(self.instance_types["ec2"][size])
+                vpc = vpcs[vpc_indices[i]]
+                instance_type = instance_types[i]
+                os_type = os_types[i]
+                ami = f"ami-{amis[i]}"
                 
-                # Operating system distribution
+                instance_name = f"{purpose}-{vpc['environment']}-{name_nums[i]:03d}"
+                is_prod = "prod" in vpc["environment"]
+                azs = vpc["availability_zones"]
+                
+                # Add SQL Server specific fields
                 if purpose == "sql-server":
-                    os_type = "Windows Server 2019"
-                    ami = f"ami-{random.randint(0, 2**64):016x}"
+                    sqlserver_fields = (
+                        random.choice(self._SQLSERVER_EDITIONS),
+                        random.choice(self._SQLSERVER_VERSIONS),
+                        random.choice(self._SQLSERVER_LICENSE_TYPES),
+                        "SQL_Latin1_General_CP1_CI_AS"
+                    )
                 else:
-                    os_type = random.choices(["Amazon Linux 2", "Ubuntu 22.04", "RHEL 8", "Windows Server 2019"], 
-                                           weights=[40, 30, 20, 10])[0]
-                    ami = f"ami-{random.randint(0, 2**64):016x}"
-                
-                # Cost calculation
-                cost_mapping = {
-                    "t3.micro": 8, "t3.small": 16, "t3.medium": 35, "t3.large": 70,
-                    "m5.large": 90, "m5.xlarge": 180, "m5.2xlarge": 360, "m5.4xlarge": 720,
-                    "c5.large": 80, "c5.xlarge": 160, "c5.2xlarge": 320, "c5.4xlarge": 640,
-                    "m5.8xlarge": 1440, "c5.9xlarge": 1440, "c5.18xlarge": 2880
-                }
-                base_cost = cost_mapping.get(instance_type, 100)
-                
-                # Windows licensing adds cost
-                license_cost = 50 if "Windows" in os_type else 0
-                storage_cost = random.randint(20, 200)  # EBS storage
-                monthly_cost = base_cost + license_cost + storage_cost
-                
-                instance_name = f"{purpose}-{vpc['environment']}-{random.randint(1, 999):03d}"
+                    sqlserver_fields = (None, None, None, None)
                 
-                instance = {
-                    "instance_id": f"i-{random.randint(0, 2**64):016x}",
-                    "name": instance_name,
-                    "instance_type": instance_type,
-                    "region": vpc["region"],
-                    "vpc_id": vpc["vpc_id"],
-                    "availability_zone": random.choice(vpc["availability_zones"]),
-                    "status": random.choices(["running", "stopped", "pending", "stopping", "terminated"], 
-                                           weights=[75, 15, 5, 3, 2])[0],
-                    "private_ip": f"10.{random.randint(10, 30)}.{random.randint(1, 254)}.{random.randint(10, 250)}",
-                    "public_ip": f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}" if random.random() < 0.1 else None,
-                    "subnet_id": f"subnet-{random.randint(10000, 99999):05x}",
-                    "security_groups": [f"sg-{purpose}-{random.randint(10000000, 99999999):08x}"],
-                    "key_pair": f"capital-{vpc['environment']}-keypair",
-                    "iam_role": f"EC2-{purpose.title()}-Role",
-                    "purpose": purpose,
-                    "os_type": os_type,
-                    "ami_id": ami,
-                    "cost_monthly": round(monthly_cost, 2),
-                    "cpu_utilization": random.uniform(5, 85),
-                    "memory_utilization": random.uniform(15, 90),
-                    "disk_utilization": random.uniform(20, 80),
-                    "environment": vpc["environment"],
-                    "business_unit": random.choice(self.business_units),
-                    "patch_group": f"{purpose}-{vpc['environment']}-patches",
-                    "monitoring_enabled": True if "prod" in vpc["environment"] else random.choice([True, False]),
-                    "created_at": (datetime.utcnow() - timedelta(days=random.randint(30, 400))).isoformat(),
-                    "ebs_volumes": [
-                        {
-                            "volume_id": f"vol-{random.randint(0, 2**64):016x}",
-                            "size": random.choice([50, 100, 200, 500, 1000]),
-                            "volume_type": random.choice(["gp3", "gp2", "io1"]),
-                            "iops": random.randint(100, 5000),
-                            "encrypted": True if "prod" in vpc["environment"] else random.choice([True, False])
-                        }
-                    ]
-                }
+                ebs_volumes = [
+                    {
+                        "volume_id": f"vol-{volume_ids[i]}",
+                        "size": volume_sizes[i],
+                        "volume_type": volume_types[i],
+                        "iops": volume_iops[i],
+                        "encrypted": True if is_prod else encryption_flips[i]
+                    }
+                ]
                 
-                # Add SQL Server specific fields
-                if purpose == "sql-server":
-                    instance.update({
-                        "sqlserver_edition": random.choice(["Enterprise", "Standard", "Web", "Express"]),
-                        "sqlserver_version": random.choice(["2019", "2017", "2016"]),
-                        "license_type": random.choice(["license-included", "bring-your-own-license"]),
-                        "collation": "SQL_Latin1_General_CP1_CI_AS"
-                    })
+                # Values in EC2_FIELDS order
+                instance = (
+                    f"i-{instance_ids[i]}", instance_name, instance_type, vpc["region"], vpc["vpc_id"],
+                    azs[int(az_picks[i] * len(azs))],
+                    statuses[i], private_ips[i], public_ips[i] if has_public_ip[i] else None,
+                    f"subnet-{subnet_nums[i]:05x}", [f"sg-{purpose}-{sg_nums[i]:08x}"],
+                    key_pairs[vpc["environment"]], iam_role, purpose, os_type, ami,
+                    monthly_costs[i],
+                    cpu_utilization[i], memory_utilization[i], disk_utilization[i], vpc["environment"],
+                    business_units[i], patch_groups[vpc["environment"]],
+                    True if is_prod else monitoring_flips[i], created_ats[i],
+                    orjson.dumps(ebs_volumes).decode(), *sqlserver_fields
+                )
                 
-                instances.append(instance)
+                generated += 1
+                yield instance
         
-        logger.info(f"✅ Generated {len(instances)} EC2 instances")
-        return instances
+        logger.info(f"✅ Generated {generated} EC2 instances")
 
     def generate_aws_services(self, vpcs: List[Dict], count: int = 1000) -> List[Dict[str, Any]]:
         """Generate 1,000+ AWS managed services (Lambda, S3, etc.)"""
-        services = []
+        rng = self._rng
         
         # Lambda functions
         lambda_patterns = [
@@ -600,316 +1163,312 @@ class EnterpriseTopologyGenerator:
             {"prefix": "ops", "functions": ["log-processor", "metric-aggregator", "alert-router", "backup-trigger", "cleanup-job"]}
         ]
         
+        now = np.datetime64(datetime.utcnow(), "us")
         lambda_count = int(count * 0.4)  # 40% Lambda functions
-        for pattern in lambda_patterns:
-            for func in pattern["functions"]:
-                for env in ["prod", "staging", "dev"]:
-                    if len(services) >= lambda_count:
-                        break
-                    
-                    vpc = random.choice([v for v in vpcs if v["environment"] == ("production" if env == "prod" else env)])
-                    
-                    lambda_func = {
-                        "name": f"{pattern['prefix']}-{func}-{env}",
-                        "arn": f"arn:aws:lambda:{vpc['region']}:123456789012:function:{pattern['prefix']}-{func}-{env}",
-                        "type": "Lambda",
-                        "runtime": random.choice(["python3.11", "python3.10", "nodejs18.x", "nodejs20.x", "java17", "dotnet8"]),
-                        "memory": random.choice([128, 256, 512, 1024, 1536, 2048, 3008]),
-                        "timeout": random.randint(3, 900),
-                        "region": vpc["region"],
-                        "vpc_id": vpc["vpc_id"] if random.random() < 0.3 else None,  # Some Lambdas not in VPC
-                        "environment": vpc["environment"],
-                        "business_unit": pattern["prefix"].title(),
-                        "invocations_per_day": random.randint(100, 100000),
-                        "avg_duration": random.randint(50, 5000),
-                        "error_rate": random.uniform(0.01, 2.5),
-                        "cost_monthly": random.uniform(5, 500),
-                        "last_modified": (datetime.utcnow() - timedelta(days=random.randint(1, 90))).isoformat(),
-                        "concurrent_executions": random.randint(1, 100),
-                        "dead_letter_queue": random.choice([True, False]),
-                        "layers": random.randint(0, 3)
-                    }
-                    services.append(lambda_func)
+        vpcs_by_env = vpcs_by_environment(vpcs)
+        lambda_specs = [
+            (pattern["prefix"], func, env)
+            for pattern in lambda_patterns
+            for func in pattern["functions"]
+            for env in ["prod", "staging", "dev"]
+        ][:lambda_count]
+        s3_count = int(count * 0.2)  # 20% S3 buckets
+        api_count = int(count * 0.1)  # 10% API Gateways
+        alb_count = int(count * 0.15)  # 15% Load Balancers
+        
+        # Totals are known up front, so fill a preallocated list instead of appending
+        fixed_count = len(lambda_specs) + s3_count + api_count + alb_count
+        services: List[Optional[Dict[str, Any]]] = [None] * max(count, fixed_count)
+        k = 0
+        
+        # Draw every per-function random field up front in vectorized batches
+        n = len(lambda_specs)
+        runtimes = self._draw(["python3.11", "python3.10", "nodejs18.x", "nodejs20.x", "java17", "dotnet8"], None, n)
+        memories = rng.choice([128, 256, 512, 1024, 1536, 2048, 3008], n).tolist()
+        timeouts = rng.integers(3, 901, n).tolist()
+        in_vpc = (rng.random(n) < 0.3).tolist()  # Some Lambdas not in VPC
+        invocations = rng.integers(100, 100001, n).tolist()
+        durations = rng.integers(50, 5001, n).tolist()
+        error_rates = rng.uniform(0.01, 2.5, n).tolist()
+        lambda_costs = rng.uniform(5, 500, n).tolist()
+        last_modified = self._isoformat_ago(now, rng.integers(1, 91, n))
+        concurrency = rng.integers(1, 101, n).tolist()
+        dead_letter_queues = (rng.random(n) < 0.5).tolist()
+        layers = rng.integers(0, 4, n).tolist()
+        vpc_picks = rng.random(n).tolist()
+        
+        for i, (prefix, func, env) in enumerate(lambda_specs):
+            env_vpcs = vpcs_by_env["production" if env == "prod" else env]
+            vpc = env_vpcs[int(vpc_picks[i] * len(env_vpcs))]
+            
+            lambda_func = {
+                "name": f"{prefix}-{func}-{env}",
+                "arn": f"arn:aws:lambda:{vpc['region']}:123456789012:function:{prefix}-{func}-{env}",
+                "type": "Lambda",
+                "runtime": runtimes[i],
+                "memory": memories[i],
+                "timeout": timeouts[i],
+                "region": vpc["region"],
+                "vpc_id": vpc["vpc_id"] if in_vpc[i] else None,
+                "environment": vpc["environment"],
+                "business_unit": prefix.title(),
+                "invocations_per_day": invocations[i],
+                "avg_duration": durations[i],
+                "error_rate": error_rates[i],
+                "cost_monthly": lambda_costs[i],
+                "last_modified": last_modified[i],
+                "concurrent_executions": concurrency[i],
+                "dead_letter_queue": dead_letter_queues[i],
+                "layers": layers[i]
+            }
+            services[k] = lambda_func
+            k += 1
         
         # S3 Buckets
-        s3_count = int(count * 0.2)  # 20% S3 buckets
         s3_purposes = ["backups", "logs", "data-lake", "static-assets", "reports", "archives", "temp-storage", "compliance-docs"]
         
+        n = s3_count
+        vpc_indices = rng.integers(0, len(vpcs), n).tolist()
+        purposes = self._draw(s3_purposes, None, n)
+        name_nums = rng.integers(1000, 10000, n).tolist()
+        arn_nums = rng.integers(1000, 10000, n).tolist()
+        storage_classes = self._draw(["STANDARD", "STANDARD_IA", "GLACIER", "DEEP_ARCHIVE"], None, n)
+        object_counts = rng.integers(1000, 10000001, n).tolist()
+        sizes_gb = rng.integers(100, 50001, n).tolist()
+        s3_costs = rng.uniform(50, 5000, n).tolist()
+        s3_business_units = self._draw(self.business_units, None, n)
+        # versioning, encryption, lifecycle and replication coin flips
+        flips = (rng.random((n, 4)) < 0.5).tolist()
+        s3_created = self._isoformat_ago(now, rng.integers(30, 501, n))
+        
         for i in range(s3_count):
-            vpc = random.choice(vpcs)
-            purpose = random.choice(s3_purposes)
+            vpc = vpcs[vpc_indices[i]]
+            purpose = purposes[i]
+            versioning, encryption, lifecycle_policy, replication = flips[i]
             
             bucket = {
-                "name": f"capital-{purpose}-{vpc['environment']}-{random.randint(1000, 9999)}",
-                "arn": f"arn:aws:s3:::capital-{purpose}-{vpc['environment']}-{random.randint(1000, 9999)}",
+                "name": f"capital-{purpose}-{vpc['environment']}-{name_nums[i]}",
+                "arn": f"arn:aws:s3:::capital-{purpose}-{vpc['environment']}-{arn_nums[i]}",
                 "type": "S3",
                 "region": vpc["region"],
                 "environment": vpc["environment"],
-                "business_unit": random.choice(self.business_units),
+                "business_unit": s3_business_units[i],
                 "purpose": purpose,
-                "storage_class": random.choice(["STANDARD", "STANDARD_IA", "GLACIER", "DEEP_ARCHIVE"]),
-                "object_count": random.randint(1000, 10000000),
-                "size_gb": random.randint(100, 50000),
-                "cost_monthly": random.uniform(50, 5000),
-                "versioning": random.choice([True, False]),
-                "encryption": True if "prod" in vpc["environment"] else random.choice([True, False]),
-                "lifecycle_policy": random.choice([True, False]),
+                "storage_class": storage_classes[i],
+                "object_count": object_counts[i],
+                "size_gb": sizes_gb[i],
+                "cost_monthly": s3_costs[i],
+                "versioning": versioning,
+                "encryption": True if "prod" in vpc["environment"] else encryption,
+                "lifecycle_policy": lifecycle_policy,
                 "public_access": False,  # Financial services security
-                "replication": random.choice([True, False]) if purpose in ["backups", "compliance-docs"] else False,
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(30, 500))).isoformat()
+                "replication": replication if purpose in ["backups", "compliance-docs"] else False,
+                "created_at": s3_created[i]
             }
-            services.append(bucket)
+            services[k] = bucket
+            k += 1
         
         # API Gateway
-        api_count = int(count * 0.1)  # 10% API Gateways
+        api_ids = self._random_hex(api_count, 32)
+        api_created = self._isoformat_ago(now, rng.integers(60, 301, api_count))
+        api_business_units = self._draw(self.business_units, None, api_count)
+        n = api_count
+        vpc_indices = rng.integers(0, len(vpcs), n).tolist()
+        api_types = self._draw(["REST", "HTTP", "WebSocket"], None, n)
+        api_requests = rng.integers(10000, 1000001, n).tolist()
+        api_latencies = rng.uniform(50, 500, n).tolist()
+        api_error_rates = rng.uniform(0.1, 3.0, n).tolist()
+        api_costs = rng.uniform(100, 2000, n).tolist()
+        caching_flips = (rng.random(n) < 0.5).tolist()
+        
         for i in range(api_count):
-            vpc = random.choice(vpcs)
-            bu = random.choice(self.business_units)
+            vpc = vpcs[vpc_indices[i]]
+            bu = api_business_units[i]
             
             api = {
                 "name": f"{bu.lower()}-api-{vpc['environment']}",
-                "arn": f"arn:aws:apigateway:{vpc['region']}::/restapis/{uuid.uuid4().hex}",
+                "arn": f"arn:aws:apigateway:{vpc['region']}::/restapis/{api_ids[i]}",
                 "type": "APIGateway",
                 "region": vpc["region"],
                 "environment": vpc["environment"],
                 "business_unit": bu,
-                "api_type": random.choice(["REST", "HTTP", "WebSocket"]),
+                "api_type": api_types[i],
                 "stage": vpc["environment"],
-                "requests_per_day": random.randint(10000, 1000000),
-                "avg_latency": random.uniform(50, 500),
-                "error_rate": random.uniform(0.1, 3.0),
-                "cost_monthly": random.uniform(100, 2000),
+                "requests_per_day": api_requests[i],
+                "avg_latency": api_latencies[i],
+                "error_rate": api_error_rates[i],
+                "cost_monthly": api_costs[i],
                 "throttling_enabled": True,
-                "caching_enabled": random.choice([True, False]),
+                "caching_enabled": caching_flips[i],
                 "cors_enabled": True,
                 "custom_domain": f"{bu.lower()}-api.capitalgroup.com" if vpc["environment"] == "production" else None,
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(60, 300))).isoformat()
+                "created_at": api_created[i]
             }
-            services.append(api)
+            services[k] = api
+            k += 1
         
         # Load Balancers
-        alb_count = int(count * 0.15)  # 15% Load Balancers
+        alb_states = self._draw(self._alb_state_vals, self._alb_state_p, alb_count)
+        alb_names = self._random_hex(alb_count, 16)
+        alb_ids = self._random_hex(alb_count, 32)
+        cert_ids = self._random_uuids(alb_count)
+        n = alb_count
+        vpc_indices = rng.integers(0, len(vpcs), n).tolist()
+        name_nums = rng.integers(1, 100, n).tolist()
+        alb_business_units = self._draw(self.business_units, None, n)
+        schemes = self._draw(["internet-facing", "internal"], None, n)
+        # Argsort of uniform draws gives one random AZ order per ALB; each keeps a 2+ prefix
+        az_orders = rng.random((n, max(len(v["availability_zones"]) for v in vpcs))).argsort(axis=1).tolist()
+        az_picks = rng.random(n).tolist()
+        target_groups = rng.integers(1, 9, n).tolist()
+        listeners = rng.integers(1, 5, n).tolist()
+        requests_per_second = rng.integers(100, 10001, n).tolist()
+        active_connections = rng.integers(50, 5001, n).tolist()
+        alb_costs = rng.uniform(25, 300, n).tolist()
+        alb_created = self._isoformat_ago(now, rng.integers(30, 201, n))
+        
         for i in range(alb_count):
-            vpc = random.choice(vpcs)
+            vpc = vpcs[vpc_indices[i]]
+            azs = vpc["availability_zones"]
+            az_count = 2 + int(az_picks[i] * (len(azs) - 1))
             
             alb = {
-                "name": f"alb-{random.choice(self.business_units).lower()}-{vpc['environment']}-{random.randint(1, 99):02d}",
-                "arn": f"arn:aws:elasticloadbalancing:{vpc['region']}:123456789012:loadbalancer/app/{uuid.uuid4().hex[:16]}/{uuid.uuid4().hex}",
+                "name": f"alb-{alb_business_units[i].lower()}-{vpc['environment']}-{name_nums[i]:02d}",
+                "arn": f"arn:aws:elasticloadbalancing:{vpc['region']}:123456789012:loadbalancer/app/{alb_names[i]}/{alb_ids[i]}",
                 "type": "ApplicationLoadBalancer",
                 "region": vpc["region"],
                 "vpc_id": vpc["vpc_id"],
                 "environment": vpc["environment"],
-                "scheme": random.choice(["internet-facing", "internal"]),
+                "scheme": schemes[i],
                 "load_balancer_type": "application",
-                "state": random.choices(["active", "provisioning", "failed"], weights=[90, 8, 2])[0],
-                "availability_zones": random.sample(vpc["availability_zones"], random.randint(2, len(vpc["availability_zones"]))),
-                "target_groups": random.randint(1, 8),
-                "listeners": random.randint(1, 4),
-                "requests_per_second": random.randint(100, 10000),
-                "active_connections": random.randint(50, 5000),
-                "cost_monthly": random.uniform(25, 300),
-                "ssl_cert": f"arn:aws:acm:{vpc['region']}:123456789012:certificate/{uuid.uuid4()}",
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(30, 200))).isoformat()
+                "state": alb_states[i],
+                "availability_zones": [azs[j] for j in az_orders[i] if j < len(azs)][:az_count],
+                "target_groups": target_groups[i],
+                "listeners": listeners[i],
+                "requests_per_second": requests_per_second[i],
+                "active_connections": active_connections[i],
+                "cost_monthly": alb_costs[i],
+                "ssl_cert": f"arn:aws:acm:{vpc['region']}:123456789012:certificate/{cert_ids[i]}",
+                "created_at": alb_created[i]
             }
-            services.append(alb)
+            services[k] = alb
+            k += 1
         
         # Additional AWS services to reach target count
-        remaining_count = count - len(services)
+        remaining_count = count - k
         other_services = ["ElastiCache", "SQS", "SNS", "CloudWatch", "KMS", "Secrets Manager", "Parameter Store"]
+        n = max(remaining_count, 0)
+        other_created = self._isoformat_ago(now, rng.integers(10, 366, n))
+        # Name and owner business units are drawn independently, as before
+        name_business_units = self._draw(self.business_units, None, n)
+        other_business_units = self._draw(self.business_units, None, n)
+        vpc_indices = rng.integers(0, len(vpcs), n).tolist()
+        service_types = self._draw(other_services, None, n)
+        name_nums = rng.integers(1, 1000, n).tolist()
+        other_costs = rng.uniform(10, 1000, n).tolist()
         
         for i in range(remaining_count):
-            vpc = random.choice(vpcs)
-            service_type = random.choice(other_services)
+            vpc = vpcs[vpc_indices[i]]
+            service_type = service_types[i]
             
             service = {
-                "name": f"{service_type.lower()}-{random.choice(self.business_units).lower()}-{vpc['environment']}-{random.randint(1, 999):03d}",
+                "name": f"{service_type.lower()}-{name_business_units[i].lower()}-{vpc['environment']}-{name_nums[i]:03d}",
                 "type": service_type,
                 "region": vpc["region"],
                 "environment": vpc["environment"],
-                "business_unit": random.choice(self.business_units),
-                "cost_monthly": random.uniform(10, 1000),
-                "created_at": (datetime.utcnow() - timedelta(days=random.randint(10, 365))).isoformat()
+                "business_unit": other_business_units[i],
+                "cost_monthly": other_costs[i],
+                "created_at": other_created[i]
             }
-            services.append(service)
+            services[k] = service
+            k += 1
         
+        del services[k:]
         logger.info(f"✅ Generated {len(services)} AWS managed services")
         return services
 
-    def create_enterprise_nodes_batch(self):
-        """Create all enterprise infrastructure nodes in batches for performance"""
-        logger.info("🚀 Generating enterprise-scale topology (50,000+ nodes)...")
-        
-        # Generate all components
-        logger.info("Generating VPCs...")
-        vpcs = self.generate_enterprise_vpcs(15)
-        
-        logger.info("Generating EKS clusters...")
-        clusters = self.generate_enterprise_eks_clusters(vpcs, 25)
-        
-        logger.info("Generating pods...")
-        pods = self.generate_massive_pod_topology(clusters, 15000)
-        
-        logger.info("Generating databases...")
-        databases = self.generate_enterprise_databases(vpcs, 50)
-        
-        logger.info("Generating EC2 instances...")
-        ec2_instances = self.generate_massive_ec2_fleet(vpcs, 8000)
+    def create_enterprise_nodes_batch(self, bulk_mode: bool = False):
+        """Create all enterprise infrastructure nodes in batches for performance
         
-        logger.info("Generating AWS services...")
-        aws_services = self.generate_aws_services(vpcs, 1000)
+        bulk_mode loads pods through LOAD CSV from NEO4J_IMPORT_DIR instead of UNWIND parameters.
+        """
+        logger.info("🚀 Generating enterprise-scale topology (50,000+ nodes)...")
+        if bulk_mode and not NEO4J_IMPORT_DIR:
+            logger.warning("bulk_mode requested but NEO4J_IMPORT_DIR is not set; loading pods over Bolt")
+            bulk_mode = False
         
-        # Create nodes in batches for performance
-        batch_size = 1000
+        # Generation runs here while a single writer thread drains finished node sets into Neo4j
+        write_queue = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+        write_errors = []
+        writer = threading.Thread(target=self._drain_write_queue, args=(write_queue, write_errors), daemon=True)
+        writer.start()
         
-        with self.driver.session() as session:
-            # Create VPCs
-            session.run("""
-            UNWIND $vpcs as vpc
-            CREATE (v:VPC:AWSResource {
-                vpc_id: vpc.vpc_id, name: vpc.name, cidr_block: vpc.cidr_block,
-                region: vpc.region, environment: vpc.environment, type: 'VPC',
-                availability_zones: vpc.availability_zones, created_at: vpc.created_at,
-                business_criticality: vpc.business_criticality, dns_hostnames: vpc.dns_hostnames,
-                dns_resolution: vpc.dns_resolution, tags: vpc.tags
-            })
-            """, vpcs=vpcs)
-            
-            # Create EKS clusters
-            session.run("""
-            UNWIND $clusters as cluster
-            CREATE (c:EKSCluster:AWSResource {
-                name: cluster.name, arn: cluster.arn, region: cluster.region, vpc_id: cluster.vpc_id,
-                version: cluster.version, status: cluster.status, endpoint: cluster.endpoint,
-                created_at: cluster.created_at, node_groups: cluster.node_groups,
-                total_nodes: cluster.total_nodes, primary_instance_type: cluster.primary_instance_type,
-                cost_monthly: cluster.cost_monthly, environment: cluster.environment,
-                business_unit: cluster.business_unit, subnet_ids: cluster.subnet_ids,
-                security_groups: cluster.security_groups, logging: cluster.logging,
-                addons: cluster.addons, type: 'EKS'
-            })
-            """, clusters=clusters)
-            
-            # Create pods in batches
-            for i in range(0, len(pods), batch_size):
-                batch = pods[i:i + batch_size]
-                session.run("""
-                UNWIND $pods as pod
-                CREATE (p:Pod {
-                    name: pod.name, namespace: pod.namespace, cluster_name: pod.cluster_name,
-                    status: pod.status, phase: pod.phase, service_name: pod.service_name,
-                    business_unit: pod.business_unit, environment: pod.environment,
-                    node_name: pod.node_name, pod_ip: pod.pod_ip, host_ip: pod.host_ip,
-                    start_time: pod.start_time, restart_count: pod.restart_count,
-                    cpu_request: pod.cpu_request, cpu_limit: pod.cpu_limit,
-                    memory_request: pod.memory_request, memory_limit: pod.memory_limit,
-                    technology_stack: pod.technology_stack, language: pod.language,
-                    framework: pod.framework, container_image: pod.container_image,
-                    container_port: pod.container_port, liveness_probe: pod.liveness_probe,
-                    readiness_probe: pod.readiness_probe, volumes: pod.volumes, labels: pod.labels
-                })
-                """, pods=batch)
-                logger.info(f"Created pod batch {i//batch_size + 1}/{(len(pods)//batch_size) + 1}")
-            
-            # Create databases in batches
-            for i in range(0, len(databases), batch_size):
-                batch = databases[i:i + batch_size]
-                session.run("""
-                UNWIND $databases as db
-                CREATE (d:RDSInstance:AWSResource {
-                    identifier: db.identifier, arn: db.arn, engine: db.engine,
-                    engine_version: db.engine_version, instance_class: db.instance_class,
-                    status: db.status, region: db.region, vpc_id: db.vpc_id,
-                    allocated_storage: db.allocated_storage, storage_type: db.storage_type,
-                    multi_az: db.multi_az, backup_retention: db.backup_retention,
-                    cost_monthly: db.cost_monthly, environment: db.environment,
-                    business_unit: db.business_unit, purpose: db.purpose,
-                    subnet_group: db.subnet_group, parameter_group: db.parameter_group,
-                    option_group: db.option_group, created_at: db.created_at,
-                    connections_active: db.connections_active, connections_max: db.connections_max,
-                    cpu_utilization: db.cpu_utilization, memory_utilization: db.memory_utilization,
-                    storage_utilization: db.storage_utilization, iops_used: db.iops_used,
-                    read_latency: db.read_latency, write_latency: db.write_latency,
-                    read_replica_source: db.read_replica_source, replica_lag: db.replica_lag,
-                    license_model: db.license_model, character_set: db.character_set,
-                    national_character_set: db.national_character_set, type: 'RDS'
-                })
-                """, databases=batch)
-                logger.info(f"Created database batch {i//batch_size + 1}/{(len(databases)//batch_size) + 1}")
+        try:
+            logger.info("Generating VPCs...")
+            vpcs = self.generate_enterprise_vpcs(15)
             
-            # Create EC2 instances in batches
-            for i in range(0, len(ec2_instances), batch_size):
-                batch = ec2_instances[i:i + batch_size]
-                session.run("""
-                UNWIND $instances as inst
-                CREATE (e:EC2Instance:AWSResource {
-                    instance_id: inst.instance_id, name: inst.name, instance_type: inst.instance_type,
-                    region: inst.region, vpc_id: inst.vpc_id, availability_zone: inst.availability_zone,
-                    status: inst.status, private_ip: inst.private_ip, public_ip: inst.public_ip,
-                    subnet_id: inst.subnet_id, security_groups: inst.security_groups,
-                    key_pair: inst.key_pair, iam_role: inst.iam_role, purpose: inst.purpose,
-                    os_type: inst.os_type, ami_id: inst.ami_id, cost_monthly: inst.cost_monthly,
-                    cpu_utilization: inst.cpu_utilization, memory_utilization: inst.memory_utilization,
-                    disk_utilization: inst.disk_utilization, environment: inst.environment,
-                    business_unit: inst.business_unit, patch_group: inst.patch_group,
-                    monitoring_enabled: inst.monitoring_enabled, created_at: inst.created_at,
-                    ebs_volumes: inst.ebs_volumes, sqlserver_edition: inst.sqlserver_edition,
-                    sqlserver_version: inst.sqlserver_version, license_type: inst.license_type,
-                    collation: inst.collation, type: 'EC2'
-                })
-                """, instances=batch)
-                logger.info(f"Created EC2 batch {i//batch_size + 1}/{(len(ec2_instances)//batch_size) + 1}")
+            # Neo4j properties can't hold maps, so nested fields travel as JSON strings
+            self._serialize_nested(vpcs, "tags")
+            write_queue.put(("VPC", VPC_INSERT_QUERY, vpcs))
             
-            # Create AWS services in batches
-            for i in range(0, len(aws_services), batch_size):
-                batch = aws_services[i:i + batch_size]
+            # Spawned (not forked) workers: this process already runs the writer thread
+            with ProcessPoolExecutor(
+                max_workers=GENERATOR_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_generator_worker
+            ) as pool:
+                # Databases and AWS services only need the VPCs, so they start while clusters are generated
+                logger.info("Generating databases and AWS services in worker processes...")
+                databases_future = pool.submit(_gen_databases, vpcs, 50)
+                aws_services_future = pool.submit(_gen_aws_services, vpcs, 1000)
                 
-                # Separate Lambda functions from other services due to different schemas
-                lambda_batch = [s for s in batch if s.get("type") == "Lambda"]
-                other_batch = [s for s in batch if s.get("type") != "Lambda"]
+                logger.info("Generating EKS clusters...")
+                clusters = self.generate_enterprise_eks_clusters(vpcs, 25)
                 
-                if lambda_batch:
-                    session.run("""
-                    UNWIND $lambdas as func
-                    CREATE (f:LambdaFunction:AWSResource {
-                        name: func.name, arn: func.arn, type: func.type, runtime: func.runtime,
-                        memory: func.memory, timeout: func.timeout, region: func.region,
-                        vpc_id: func.vpc_id, environment: func.environment, business_unit: func.business_unit,
-                        invocations_per_day: func.invocations_per_day, avg_duration: func.avg_duration,
-                        error_rate: func.error_rate, cost_monthly: func.cost_monthly,
-                        last_modified: func.last_modified, concurrent_executions: func.concurrent_executions,
-                        dead_letter_queue: func.dead_letter_queue, layers: func.layers
-                    })
-                    """, lambdas=lambda_batch)
+                self._serialize_nested(clusters, "logging")
+                write_queue.put(("EKS cluster", EKS_CLUSTER_INSERT_QUERY, clusters))
                 
-                if other_batch:
-                    session.run("""
-                    UNWIND $services as svc
-                    CREATE (s:AWSService:AWSResource {
-                        name: svc.name, arn: svc.arn, type: svc.type, region: svc.region,
-                        environment: svc.environment, business_unit: svc.business_unit,
-                        cost_monthly: svc.cost_monthly, created_at: svc.created_at,
-                        storage_class: svc.storage_class, object_count: svc.object_count,
-                        size_gb: svc.size_gb, versioning: svc.versioning, encryption: svc.encryption,
-                        lifecycle_policy: svc.lifecycle_policy, public_access: svc.public_access,
-                        replication: svc.replication, purpose: svc.purpose,
-                        api_type: svc.api_type, stage: svc.stage, requests_per_day: svc.requests_per_day,
-                        avg_latency: svc.avg_latency, error_rate: svc.error_rate,
-                        throttling_enabled: svc.throttling_enabled, caching_enabled: svc.caching_enabled,
-                        cors_enabled: svc.cors_enabled, custom_domain: svc.custom_domain
-                    })
-                    """, services=other_batch)
+                logger.info("Generating pods in a worker process...")
+                pods_future = pool.submit(_gen_pods, clusters, 15000)
                 
-                logger.info(f"Created AWS services batch {i//batch_size + 1}/{(len(aws_services)//batch_size) + 1}")
+                # EC2 rows stream from this process while the workers run
+                logger.info("Generating EC2 instances...")
+                ec2_count = self._stream_to_writer(
+                    write_queue, "EC2", EC2_INSERT_QUERY, self.generate_massive_ec2_fleet(vpcs, 8000)
+                )
+                
+                pods = pods_future.result()
+                if bulk_mode:
+                    pods.write_csv(os.path.join(NEO4J_IMPORT_DIR, POD_CSV_FILE))
+                    write_queue.put(("pod", POD_LOAD_CSV_QUERY, None))
+                else:
+                    write_queue.put(("pod", POD_INSERT_QUERY, pods))
+                
+                databases = databases_future.result()
+                write_queue.put(("database", RDS_INSERT_QUERY, databases))
+                db_count = sum(1 + len(db["replicas"]) for db in databases)
+                
+                aws_services = aws_services_future.result()
+            
+            # Lambda functions and other services have different schemas
+            write_queue.put(("Lambda", LAMBDA_INSERT_QUERY, [s for s in aws_services if s.get("type") == "Lambda"]))
+            write_queue.put(("AWS service", AWS_SERVICE_INSERT_QUERY, [s for s in aws_services if s.get("type") != "Lambda"]))
+        finally:
+            write_queue.put(None)
+            writer.join()
         
-        logger.info(f"✅ Created {len(vpcs)} VPCs, {len(clusters)} clusters, {len(pods)} pods, {len(databases)} databases, {len(ec2_instances)} EC2 instances, {len(aws_services)} AWS services")
+        if write_errors:
+            raise write_errors[0]
+        
+        logger.info(f"✅ Created {len(vpcs)} VPCs, {len(clusters)} clusters, {len(pods)} pods, {db_count} databases, {ec2_count} EC2 instances, {len(aws_services)} AWS services")
         return {
             "vpcs": len(vpcs),
             "clusters": len(clusters), 
             "pods": len(pods),
-            "databases": len(databases),
-            "ec2_instances": len(ec2_instances),
+            "databases": db_count,
+            "ec2_instances": ec2_count,
             "aws_services": len(aws_services),
-            "total_nodes": len(vpcs) + len(clusters) + len(pods) + len(databases) + len(ec2_instances) + len(aws_services)
+            "total_nodes": len(vpcs) + len(clusters) + len(pods) + db_count + ec2_count + len(aws_services)
         }
 
     def create_enterprise_relationships_batch(self):
@@ -973,15 +1532,19 @@ class EnterpriseTopologyGenerator:
                 ("limit-monitor", "exposure-analyzer")
             ]
             
-            all_deps = trading_deps + portfolio_deps + risk_deps
+            all_deps = [
+                {"dependent": dependent, "dependency": dependency}
+                for dependent, dependency in trading_deps + portfolio_deps + risk_deps
+            ]
             
-            for dependent, dependency in all_deps:
-                session.run("""
-                MATCH (s1:Pod), (s2:Pod)
-                WHERE s1.service_name CONTAINS $dependent AND s2.service_name CONTAINS $dependency
-                AND s1.environment = s2.environment
-                CREATE (s1)-[:DEPENDS_ON]->(s2)
-                """, dependent=dependent, dependency=dependency)
+            # One query for every pair instead of a round-trip (and pod scan) per pair
+            session.run("""
+            UNWIND $deps AS d
+            MATCH (s1:Pod) WHERE s1.service_name CONTAINS d.dependent
+            MATCH (s2:Pod) WHERE s2.service_name CONTAINS d.dependency
+            AND s1.environment = s2.environment
+            CREATE (s1)-[:DEPENDS_ON]->(s2)
+            """, deps=all_deps)
             
             # Database connections
             logger.info("Creating database connections...")
@@ -1016,115 +1579,74 @@ class EnterpriseTopologyGenerator:
             
         logger.info("✅ Enterprise relationships created")
 
-    def add_cost_optimization_opportunities(self):
+    def add_cost_optimization_opportunities(self, session):
         """Add specific cost optimization scenarios for demo"""
         logger.info("Adding cost optimization opportunities...")
         
-        with self.driver.session() as session:
-            # Mark oversized instances for rightsizing
-            session.run("""
-            MATCH (e:EC2Instance)
-            WHERE e.instance_type IN ['m5.4xlarge', 'm5.8xlarge', 'c5.4xlarge', 'c5.9xlarge']
-            AND e.cpu_utilization < 40
-            SET e.optimization_opportunity = 'rightsize',
+        # Marked nodes also get the CostOptimizationCandidate label so readers can find them by
+        # label scan instead of a property test on every node.
+        # One pass per label, committed server-side every 10,000 rows (auto-commit runs, like the
+        # node inserts); each pass returns its own count and savings so no re-scan is needed to total them
+        
+        # EC2: rightsize oversized, idle instances and move running non-prod ones to spot. Spot wins
+        # where both apply; the rightsizing recommendation is kept either way.
+        ec2 = session.run("""
+        MATCH (e:EC2Instance)
+        WITH e,
+            e.instance_type IN ['m5.4xlarge', 'm5.8xlarge', 'c5.4xlarge', 'c5.9xlarge']
+                AND e.cpu_utilization < 40 AS oversized,
+            e.environment IN ['dev', 'qa', 'staging'] AND e.status = 'running' AS spot_candidate
+        WHERE oversized OR spot_candidate
+        CALL {
+            WITH e, oversized, spot_candidate
+            SET e:CostOptimizationCandidate,
+                e.optimization_opportunity = CASE WHEN spot_candidate THEN 'spot_instance' ELSE 'rightsize' END,
                 e.recommended_instance_type = CASE
+                    WHEN NOT oversized THEN e.recommended_instance_type
                     WHEN e.instance_type = 'm5.8xlarge' THEN 'm5.4xlarge'
                     WHEN e.instance_type = 'm5.4xlarge' THEN 'm5.2xlarge'
                     WHEN e.instance_type = 'c5.9xlarge' THEN 'c5.4xlarge'
                     WHEN e.instance_type = 'c5.4xlarge' THEN 'c5.2xlarge'
                     ELSE 'm5.large'
                 END,
-                e.potential_monthly_savings = e.cost_monthly * 0.4
-            """)
-            
-            # Mark development instances for spot
-            session.run("""
-            MATCH (e:EC2Instance)
-            WHERE e.environment IN ['dev', 'qa', 'staging']
-            AND e.status = 'running'
-            SET e.optimization_opportunity = 'spot_instance',
-                e.potential_monthly_savings = e.cost_monthly * 0.7
-            """)
-            
-            # Mark underutilized RDS instances
-            session.run("""
-            MATCH (d:RDSInstance)
-            WHERE d.cpu_utilization < 25
-            AND d.connections_active < (d.connections_max * 0.2)
-            SET d.optimization_opportunity = 'downsize',
+                e.potential_monthly_savings = e.cost_monthly * CASE WHEN spot_candidate THEN 0.7 ELSE 0.4 END
+            RETURN e.potential_monthly_savings AS savings
+        } IN TRANSACTIONS OF 10000 ROWS
+        RETURN count(*) AS optimization_count, coalesce(sum(savings), 0) AS monthly_savings
+        """).single()
+        
+        # Mark underutilized RDS instances
+        rds = session.run("""
+        MATCH (d:RDSInstance)
+        WHERE d.cpu_utilization < 25
+        AND d.connections_active < (d.connections_max * 0.2)
+        CALL {
+            WITH d
+            SET d:CostOptimizationCandidate,
+                d.optimization_opportunity = 'downsize',
                 d.potential_monthly_savings = d.cost_monthly * 0.3
-            """)
-            
-            # Calculate total savings
-            result = session.run("""
-            MATCH (n)
-            WHERE n.potential_monthly_savings IS NOT NULL
-            RETURN 
-                count(n) as optimization_count,
-                sum(n.potential_monthly_savings) as total_monthly_savings,
-                sum(n.potential_monthly_savings) * 12 as total_annual_savings
-            """).single()
-            
-            logger.info(f"✅ Added {result['optimization_count']} optimization opportunities worth ${result['total_annual_savings']:,.0f} annually")
+            RETURN d.potential_monthly_savings AS savings
+        } IN TRANSACTIONS OF 10000 ROWS
+        RETURN count(*) AS optimization_count, coalesce(sum(savings), 0) AS monthly_savings
+        """).single()
+        
+        optimization_count = ec2["optimization_count"] + rds["optimization_count"]
+        total_annual_savings = (ec2["monthly_savings"] + rds["monthly_savings"]) * 12
+        logger.info(f"✅ Added {optimization_count} optimization opportunities worth ${total_annual_savings:,.0f} annually")
 
-    def add_security_vulnerabilities(self):
+    def add_security_vulnerabilities(self, session):
         """Add security vulnerabilities for demo scenarios"""
         logger.info("Adding security vulnerabilities for demo...")
         
-        with self.driver.session() as session:
-            # Critical vulnerabilities
-            session.run("""
-            MATCH (p:Pod)
-            WHERE rand() < 0.02  // 2% have critical vulnerabilities
-            SET p.security_status = 'critical',
-                p.vulnerabilities = [
-                    {cve: 'CVE-2024-3094', severity: 'CRITICAL', score: 10.0, description: 'Remote code execution in XZ Utils'},
-                    {cve: 'CVE-2024-6387', severity: 'HIGH', score: 8.1, description: 'SSH vulnerability allowing privilege escalation'}
-                ],
-                p.compliance_status = 'non_compliant',
-                p.last_scan: datetime().isoformat()
-            """)
-            
-            # High vulnerabilities
-            session.run("""
-            MATCH (p:Pod)
-            WHERE rand() < 0.08  // 8% have high vulnerabilities
-            AND p.security_status IS NULL
-            SET p.security_status = 'high',
-                p.vulnerabilities = [
-                    {cve: 'CVE-2024-22195', severity: 'HIGH', score: 7.5, description: 'Jinja2 template injection vulnerability'},
-                    {cve: 'CVE-2024-35195', severity: 'MEDIUM', score: 6.2, description: 'Information disclosure in HTTP headers'}
-                ],
-                p.compliance_status = 'review_required',
-                p.last_scan: datetime().isoformat()
-            """)
-            
-            # Medium vulnerabilities  
-            session.run("""
-            MATCH (p:Pod)
-            WHERE rand() < 0.15  // 15% have medium vulnerabilities
-            AND p.security_status IS NULL
-            SET p.security_status = 'medium',
-                p.vulnerabilities = [
-                    {cve: 'CVE-2024-12345', severity: 'MEDIUM', score: 5.3, description: 'Outdated dependency with known issues'}
-                ],
-                p.compliance_status = 'compliant',
-                p.last_scan: datetime().isoformat()
-            """)
-            
-            # Clean/compliant pods
-            session.run("""
-            MATCH (p:Pod)
-            WHERE p.security_status IS NULL
-            SET p.security_status = 'clean',
-                p.vulnerabilities = [],
-                p.compliance_status = 'compliant',
-                p.last_scan: datetime().isoformat()
-            """)
-            
+        # One label scan: each pod rolls once and takes the first tier it falls under,
+        # committed server-side every 10,000 pods to keep heap and transaction log bounded
+        session.run(
+            POD_VULNERABILITY_QUERY, tiers=self._VULNERABILITY_TIERS, scanned_at=datetime.utcnow().isoformat()
+        ).consume()
+        
         logger.info("✅ Security vulnerabilities added for demo scenarios")
 
-    def generate_enterprise_topology(self, clear_existing: bool = True):
+    def generate_enterprise_topology(self, clear_existing: bool = True, bulk_mode: bool = False):
         """Generate complete enterprise topology with 50,000+ nodes"""
         start_time = time.time()
         
@@ -1132,30 +1654,32 @@ class EnterpriseTopologyGenerator:
             if clear_existing:
                 self.clear_existing_data()
             
+            # Schema goes in before any nodes so inserts maintain the indexes the relationship MATCHes use
             self.create_enhanced_constraints_and_indexes()
-            time.sleep(3)  # Give Neo4j time to process constraints
             
             # Generate and create all components
-            node_counts = self.create_enterprise_nodes_batch()
+            node_counts = self.create_enterprise_nodes_batch(bulk_mode=bulk_mode)
             
             # Create relationships
             self.create_enterprise_relationships_batch()
             
-            # Add demo-specific enhancements
-            self.add_cost_optimization_opportunities()
-            self.add_security_vulnerabilities()
-            
-            # Final verification
-            with self.driver.session() as session:
-                node_count = session.run("MATCH (n) RETURN count(n) as count").single()["count"]
-                rel_count = session.run("MATCH ()-[r]->() RETURN count(r) as count").single()["count"]
+            # Demo enhancements and the final verification share one session (and its connection)
+            with self.driver.session(database="neo4j") as session:
+                self.add_cost_optimization_opportunities(session)
+                self.add_security_vulnerabilities(session)
                 
-                # Performance stats
-                avg_degree = session.run("""
-                MATCH (n)
-                OPTIONAL MATCH (n)-[r]-()
-                RETURN avg(count(r)) as avg_degree
-                """).single()["avg_degree"]
+                # Final verification
+                # Independent subqueries keep each count a count-store lookup, in one round trip
+                counts = session.run("""
+                CALL { MATCH (n) RETURN count(n) AS node_count }
+                CALL { MATCH ()-[r]->() RETURN count(r) AS rel_count }
+                RETURN node_count, rel_count
+                """).single()
+                node_count, rel_count = counts["node_count"], counts["rel_count"]
+                
+                # Performance stats: both counts above come from the count store, so derive the
+                # average degree from them instead of expanding every node's relationships
+                avg_degree = 2 * rel_count / node_count if node_count else 0.0
                 
                 execution_time = time.time() - start_time
                 
@@ -1180,10 +1704,34 @@ class EnterpriseTopologyGenerator:
         except Exception as e:
             logger.error(f"❌ Enterprise topology generation failed: {e}")
             raise
-        finally:
+
+    def close(self):
+        """Close the driver's connection pool; it stays open across generation runs until then"""
+        if self.driver is not None:
             self.driver.close()
 
+# Generation-only instance owned by each ProcessPoolExecutor worker
+_worker_generator: Optional[EnterpriseTopologyGenerator] = None
+
+def _init_generator_worker():
+    """Worker initializer: reseed the stdlib RNG and build a driverless generator"""
+    global _worker_generator
+    random.seed()
+    _worker_generator = EnterpriseTopologyGenerator(neo4j_uri=None)
+
+def _gen_pods(clusters: List[Dict], target_pods: int) -> ColumnarRows:
+    return _worker_generator.generate_massive_pod_topology(clusters, target_pods)
+
+def _gen_databases(vpcs: List[Dict], count: int) -> List[Dict[str, Any]]:
+    return _worker_generator.generate_enterprise_databases(vpcs, count)
+
+def _gen_aws_services(vpcs: List[Dict], count: int) -> List[Dict[str, Any]]:
+    return _worker_generator.generate_aws_services(vpcs, count)
+
 if __name__ == "__main__":
     generator = EnterpriseTopologyGenerator()
-    result = generator.generate_enterprise_topology()
+    try:
+        result = generator.generate_enterprise_topology()
+    finally:
+        generator.close()
     print(f"Enterprise topology generation result: {json.dumps(result, indent=2)}")
\ No newline at end of file
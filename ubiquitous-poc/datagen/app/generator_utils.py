@@ -0,0 +1,22 @@
+"""
+Shared helpers for the Ubiquitous POC data generators
+"""
+
+import random
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+def pick_weighted(table: Tuple[Tuple[str, ...], Tuple[int, ...]]) -> str:
+    """One weighted draw from a (population, cumulative weights) table; same distribution as random.choices"""
+    population, cum_weights = table
+    return population[bisect_right(cum_weights, random.random() * cum_weights[-1])]
+
+
+def vpcs_by_environment(vpcs: List[Dict]) -> Dict[str, List[Dict]]:
+    """Bucket VPCs by environment once so per-row placement is a dict lookup"""
+    buckets = defaultdict(list)
+    for vpc in vpcs:
+        buckets[vpc["environment"]].append(vpc)
+    return buckets
@@ -6,9 +6,12 @@ Orchestrates continuous data generation for the POC environment
 
 import asyncio
 import logging
+import random
 import signal
 import sys
+import time
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, Dict, Any
 
 from database_populator import DatabasePopulator
@@ -24,10 +27,6 @@ class DataGeneratorService:
     def __init__(self):
         self.logger = self._setup_logging()
         self.populator = DatabasePopulator()
-        self.enterprise_generator = EnterpriseTopologyGenerator()
-        self.capital_group_generator = CapitalGroupDataGenerator()
-        self.cost_calculator = CostSavingsCalculator()
-        self.demo_orchestrator = DemoScenarioOrchestrator()
         self.running = False
         self.tasks: Dict[str, asyncio.Task] = {}
         
@@ -35,11 +34,30 @@ class DataGeneratorService:
         self.config = {
             'historical_days': 90,
             'realtime_interval': 60,  # seconds
+            'components_refresh_interval': 1800,  # 30 minutes
             'health_check_interval': 300,  # 5 minutes
             'status_report_interval': 1800,  # 30 minutes
             'use_enterprise_generator': False,  # Use AWS generator with Load Balancers and Web Services
         }
     
+    # The enterprise pipeline is off by default, so its generators (and their Neo4j
+    # driver pools) are only built on first use
+    @cached_property
+    def enterprise_generator(self) -> EnterpriseTopologyGenerator:
+        return EnterpriseTopologyGenerator()
+    
+    @cached_property
+    def capital_group_generator(self) -> CapitalGroupDataGenerator:
+        return CapitalGroupDataGenerator()
+    
+    @cached_property
+    def cost_calculator(self) -> CostSavingsCalculator:
+        return CostSavingsCalculator()
+    
+    @cached_property
+    def demo_orchestrator(self) -> DemoScenarioOrchestrator:
+        return DemoScenarioOrchestrator()
+    
     def _setup_logging(self) -> logging.Logger:
         """Configure logging for the service"""
         logger = logging.getLogger('datagen_service')
@@ -104,17 +122,25 @@ class DataGeneratorService:
             if self.config['use_enterprise_generator']:
                 self.logger.info("🏗️ Using enhanced enterprise topology generator...")
                 
+                # The generators and calculator are synchronous (sync Neo4j driver, CPU-bound
+                # generation), so they run in worker threads to keep this loop's other tasks live
+                
                 # Generate enterprise-scale topology (50,000+ nodes)
                 self.logger.info("Generating enterprise-scale infrastructure topology...")
-                enterprise_topology = self.enterprise_generator.generate_enterprise_topology()
+                enterprise_topology = await asyncio.to_thread(self.enterprise_generator.generate_enterprise_topology)
+                await self.demo_orchestrator.invalidate_topology_cache()
                 
                 # Generate Capital Group specific data
                 self.logger.info("🏦 Generating Capital Group specific data patterns...")
-                capital_group_data = self.capital_group_generator.generate_capital_group_complete_dataset()
+                capital_group_data = await asyncio.to_thread(
+                    self.capital_group_generator.generate_capital_group_complete_dataset
+                )
                 
                 # Calculate cost optimization opportunities
                 self.logger.info("💰 Calculating cost optimization scenarios...")
-                cost_savings_data = self.cost_calculator.generate_savings_dashboard_data(enterprise_topology)
+                cost_savings_data = await asyncio.to_thread(
+                    self.cost_calculator.generate_savings_dashboard_data, enterprise_topology
+                )
                 
                 # Setup demo scenarios
                 self.logger.info("🎭 Setting up demo scenarios...")
@@ -158,23 +184,22 @@ class DataGeneratorService:
             self.running = True
             self.logger.info("🎯 Starting continuous data generation...")
             
-            # Start background tasks
-            self.tasks['realtime_metrics'] = asyncio.create_task(
-                self._realtime_metrics_task()
-            )
-            
-            self.tasks['health_check'] = asyncio.create_task(
-                self._health_check_task()
-            )
-            
-            self.tasks['status_report'] = asyncio.create_task(
-                self._status_report_task()
-            )
-            
-            self.logger.info("✅ All background tasks started")
-            
-            # Wait for tasks to complete or service to stop
-            await self._wait_for_completion()
+            # The group waits on every background task and, if one fails, cancels the
+            # others and re-raises; handles stay in self.tasks so stop() can cancel them
+            async with asyncio.TaskGroup() as tg:
+                self.tasks['realtime_metrics'] = tg.create_task(
+                    self._realtime_metrics_task()
+                )
+                
+                self.tasks['health_check'] = tg.create_task(
+                    self._health_check_task()
+                )
+                
+                self.tasks['status_report'] = tg.create_task(
+                    self._status_report_task()
+                )
+                
+                self.logger.info("✅ All background tasks started")
             
         except Exception as e:
             self.logger.error(f"Service error: {e}")
@@ -184,30 +209,55 @@ class DataGeneratorService:
         """Background task for real-time metrics generation"""
         self.logger.info("🔄 Real-time metrics generation started")
         
-        # Get infrastructure components once
+        # Infrastructure components are re-read from the graph every components_refresh_interval,
+        # so a regenerated topology is picked up without scanning the graph every cycle
         components = await self.populator._get_infrastructure_components()
+        components_fetched_at = time.monotonic()
+        
+        # Jittered exponential backoff so failing workers don't retry in lockstep
+        backoff = 1.0
+        backoff_cap = 60.0
+        
+        # Ticks are scheduled against fixed monotonic deadlines so cycle time doesn't add drift
+        interval = self.config['realtime_interval']
+        deadline = time.monotonic()
         
         while self.running:
             try:
+                if time.monotonic() - components_fetched_at >= self.config['components_refresh_interval']:
+                    components = await self.populator._get_infrastructure_components()
+                    components_fetched_at = time.monotonic()
+                
                 # Generate current metrics
                 current_metrics = self.populator.metrics_generator.generate_realtime_metrics(components)
                 
-                # Insert into database
-                await self.populator._insert_metrics_batch(current_metrics)
-                
-                # Cache latest metrics in Redis
-                await self.populator._cache_latest_metrics(current_metrics)
+                # Insert into TimescaleDB and cache the latest values in Redis concurrently;
+                # the two backends are independent and neither call mutates the batch
+                await asyncio.gather(
+                    self.populator._insert_metrics_batch(current_metrics, realtime=True),
+                    self.populator._cache_latest_metrics(current_metrics)
+                )
                 
                 # Calculate total records generated this cycle
                 total_records = sum(len(records) for records in current_metrics.values())
-                self.logger.debug(f"Generated {total_records} metrics records")
+                self.logger.debug("Generated %s metrics records", total_records)
+                backoff = 1.0
                 
-                # Wait for next interval
-                await asyncio.sleep(self.config['realtime_interval'])
+                # Wait out the rest of this interval
+                deadline += interval
+                remaining = deadline - time.monotonic()
+                if remaining < 0:
+                    # Overran: skip the missed ticks rather than bursting to catch up
+                    self.logger.warning("Real-time metrics cycle overran its interval by %.1fs", -remaining)
+                    deadline = time.monotonic()
+                    remaining = 0
+                await asyncio.sleep(remaining)
                 
             except Exception as e:
                 self.logger.error(f"Real-time metrics error: {e}")
-                await asyncio.sleep(10)  # Short retry delay
+                await asyncio.sleep(random.uniform(0.5, backoff))
+                backoff = min(backoff_cap, backoff * 2)
+                deadline = time.monotonic()
     
     async def _health_check_task(self):
         """Background task for health monitoring"""
@@ -245,25 +295,22 @@ class DataGeneratorService:
             try:
                 status = await self.populator.get_population_status()
                 
-                # Log comprehensive status
-                self.logger.info("=== DATA GENERATION STATUS REPORT ===")
-                self.logger.info(f"Timestamp: {status.get('timestamp', 'unknown')}")
-                
+                # Log comprehensive status as one multi-line record (one handler pass, not one per line)
                 infra = status.get('infrastructure', {})
-                self.logger.info(f"Infrastructure nodes: {infra.get('total_nodes', 0)}")
-                for node_type, count in infra.get('nodes', {}).items():
-                    self.logger.info(f"  {node_type}: {count}")
-                
                 metrics = status.get('metrics', {})
-                self.logger.info(f"Total metrics records: {metrics.get('total_records', 0)}")
-                for table, count in metrics.get('table_counts', {}).items():
-                    if count > 0:
-                        self.logger.info(f"  {table}: {count:,}")
-                
                 cache = status.get('cache', {})
-                self.logger.info(f"Cache keys: {cache.get('keys', 0)}")
-                self.logger.info(f"Memory usage: {cache.get('memory_usage', 'unknown')}")
-                self.logger.info("=====================================")
+                lines = [
+                    "=== DATA GENERATION STATUS REPORT ===",
+                    f"Timestamp: {status.get('timestamp', 'unknown')}",
+                    f"Infrastructure nodes: {infra.get('total_nodes', 0)}",
+                    *(f"  {node_type}: {count}" for node_type, count in infra.get('nodes', {}).items()),
+                    f"Total metrics records: {metrics.get('total_records', 0)}",
+                    *(f"  {table}: {count:,}" for table, count in metrics.get('table_counts', {}).items() if count > 0),
+                    f"Cache keys: {cache.get('keys', 0)}",
+                    f"Memory usage: {cache.get('memory_usage', 'unknown')}",
+                    "====================================="
+                ]
+                self.logger.info("\n".join(lines))
                 
                 await asyncio.sleep(self.config['status_report_interval'])
                 
@@ -271,29 +318,6 @@ class DataGeneratorService:
                 self.logger.error(f"Status report error: {e}")
                 await asyncio.sleep(60)  # Retry in 1 minute
     
-    async def _wait_for_completion(self):
-        """Wait for all tasks to complete or service to stop"""
-        try:
-            # Wait for any task to complete (shouldn't happen in normal operation)
-            done, pending = await asyncio.wait(
-                self.tasks.values(),
-                return_when=asyncio.FIRST_COMPLETED
-            )
-            
-            # If any task completed unexpectedly, log it
-            for task in done:
-                if task.exception():
-                    self.logger.error(f"Task failed: {task.exception()}")
-                else:
-                    self.logger.warning("Task completed unexpectedly")
-            
-            # Cancel remaining tasks
-            for task in pending:
-                task.cancel()
-                
-        except Exception as e:
-            self.logger.error(f"Wait completion error: {e}")
-    
     async def stop(self):
         """Stop the data generation service"""
         self.logger.info("🛑 Stopping data generation service...")
@@ -311,6 +335,11 @@ class DataGeneratorService:
         
         # Cleanup database connections
         await self.populator.cleanup()
+        # Only close what was actually built; touching the properties here would create them
+        if 'enterprise_generator' in self.__dict__:
+            self.enterprise_generator.close()
+        if 'demo_orchestrator' in self.__dict__:
+            await self.demo_orchestrator.close()
         
         self.logger.info("✅ Data generation service stopped")
     
@@ -398,7 +427,14 @@ Environment Variables:
                 
                 logger.info("🏗️ Running enterprise topology generator...")
                 generator = EnterpriseTopologyGenerator()
-                topology = generator.generate_enterprise_topology()
+                try:
+                    topology = generator.generate_enterprise_topology()
+                finally:
+                    generator.close()
+                
+                # The regenerated graph has new pod names and tiers, so drop results cached from the old one
+                async with DemoScenarioOrchestrator() as orchestrator:
+                    await orchestrator.invalidate_topology_cache()
                 
                 logger.info("🏦 Generating Capital Group data...")
                 cg_generator = CapitalGroupDataGenerator()
@@ -8,13 +8,53 @@ import asyncpg
 import random
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import math
+from operator import itemgetter
 import json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are bulk-loaded with COPY; smaller ones use
+# executemany, where COPY setup would cost more than it saves.
+COPY_THRESHOLD = 100
+
+SYSTEM_METRIC_COLUMNS = (
+    "time", "service_name", "cluster_name", "region", "environment",
+    "cpu_utilization", "memory_utilization", "disk_utilization",
+    "network_in_bytes", "network_out_bytes", "request_count",
+    "response_time_ms", "error_rate", "throughput_rps", "active_connections",
+    "pod_count", "replica_count", "pending_pods", "failed_pods",
+)
+
+DATABASE_METRIC_COLUMNS = (
+    "time", "db_identifier", "db_engine", "instance_class", "region",
+    "cpu_utilization", "database_connections", "read_iops", "write_iops",
+    "read_latency_ms", "write_latency_ms", "read_throughput_bytes", "write_throughput_bytes",
+    "free_storage_bytes", "free_memory_bytes", "swap_usage_bytes",
+    "slow_queries", "deadlocks", "lock_waits", "buffer_cache_hit_ratio",
+)
+
+NETWORK_METRIC_COLUMNS = (
+    "time", "source_service", "target_service", "source_cluster", "target_cluster",
+    "connection_type", "region", "avg_latency_ms", "p50_latency_ms", "p95_latency_ms", "p99_latency_ms",
+    "request_count", "byte_count", "error_count", "timeout_count",
+    "active_connections", "connection_pool_utilization", "tcp_retransmissions", "packet_loss_rate",
+)
+
+COST_METRIC_COLUMNS = (
+    "time", "resource_id", "resource_type", "resource_name", "region", "environment", "cost_center",
+    "hourly_cost", "daily_cost", "monthly_cost", "usage_quantity", "usage_unit",
+    "estimated_waste", "optimization_potential", "rightsizing_recommendation",
+)
+
+BUSINESS_VALUE_METRIC_COLUMNS = (
+    "time", "metric_type", "category", "service_name", "cluster_name", "region", "team",
+    "cost_savings_usd", "time_savings_hours", "efficiency_gain_percent", "risk_reduction_score",
+    "initiative_name", "description", "measurement_method", "confidence_level",
+)
+
 class MetricsGenerator:
     """Generates synthetic time-series metrics for AWS infrastructure"""
     
@@ -521,120 +561,45 @@ class MetricsGenerator:
             
         return metrics
 
-    async def insert_system_metrics(self, metrics: List[Dict[str, Any]]):
-        """Insert system metrics into TimescaleDB"""
+    async def _insert_rows(self, table: str, columns: Tuple[str, ...], metrics: List[Dict[str, Any]]):
+        """Insert metric dicts into a hypertable, using COPY for large batches"""
         if not metrics:
             return
-            
+
+        row = itemgetter(*columns)
         async with self.pool.acquire() as conn:
-            await conn.executemany("""
-                INSERT INTO system_metrics (
-                    time, service_name, cluster_name, region, environment,
-                    cpu_utilization, memory_utilization, disk_utilization,
-                    network_in_bytes, network_out_bytes, request_count,
-                    response_time_ms, error_rate, throughput_rps, active_connections,
-                    pod_count, replica_count, pending_pods, failed_pods
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19
+            if len(metrics) >= COPY_THRESHOLD:
+                # Binary COPY streams the batch in one round trip instead of
+                # a bind/execute per row.
+                await conn.copy_records_to_table(
+                    table, records=(row(m) for m in metrics), columns=columns
+                )
+            else:
+                placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+                await conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                    [row(m) for m in metrics]
                 )
-            """, [
-                (m["time"], m["service_name"], m["cluster_name"], m["region"], m["environment"],
-                 m["cpu_utilization"], m["memory_utilization"], m["disk_utilization"],
-                 m["network_in_bytes"], m["network_out_bytes"], m["request_count"],
-                 m["response_time_ms"], m["error_rate"], m["throughput_rps"], m["active_connections"],
-                 m["pod_count"], m["replica_count"], m["pending_pods"], m["failed_pods"])
-                for m in metrics
-            ])
+
+    async def insert_system_metrics(self, metrics: List[Dict[str, Any]]):
+        """Insert system metrics into TimescaleDB"""
+        await self._insert_rows("system_metrics", SYSTEM_METRIC_COLUMNS, metrics)
 
     async def insert_database_metrics(self, metrics: List[Dict[str, Any]]):
         """Insert database metrics into TimescaleDB"""
-        if not metrics:
-            return
-            
-        async with self.pool.acquire() as conn:
-            await conn.executemany("""
-                INSERT INTO database_metrics (
-                    time, db_identifier, db_engine, instance_class, region,
-                    cpu_utilization, database_connections, read_iops, write_iops,
-                    read_latency_ms, write_latency_ms, read_throughput_bytes, write_throughput_bytes,
-                    free_storage_bytes, free_memory_bytes, swap_usage_bytes,
-                    slow_queries, deadlocks, lock_waits, buffer_cache_hit_ratio
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20
-                )
-            """, [
-                (m["time"], m["db_identifier"], m["db_engine"], m["instance_class"], m["region"],
-                 m["cpu_utilization"], m["database_connections"], m["read_iops"], m["write_iops"],
-                 m["read_latency_ms"], m["write_latency_ms"], m["read_throughput_bytes"], m["write_throughput_bytes"],
-                 m["free_storage_bytes"], m["free_memory_bytes"], m["swap_usage_bytes"],
-                 m["slow_queries"], m["deadlocks"], m["lock_waits"], m["buffer_cache_hit_ratio"])
-                for m in metrics
-            ])
+        await self._insert_rows("database_metrics", DATABASE_METRIC_COLUMNS, metrics)
 
     async def insert_network_metrics(self, metrics: List[Dict[str, Any]]):
         """Insert network metrics into TimescaleDB"""
-        if not metrics:
-            return
-            
-        async with self.pool.acquire() as conn:
-            await conn.executemany("""
-                INSERT INTO network_metrics (
-                    time, source_service, target_service, source_cluster, target_cluster,
-                    connection_type, region, avg_latency_ms, p50_latency_ms, p95_latency_ms, p99_latency_ms,
-                    request_count, byte_count, error_count, timeout_count,
-                    active_connections, connection_pool_utilization, tcp_retransmissions, packet_loss_rate
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19
-                )
-            """, [
-                (m["time"], m["source_service"], m["target_service"], m["source_cluster"], m["target_cluster"],
-                 m["connection_type"], m["region"], m["avg_latency_ms"], m["p50_latency_ms"], m["p95_latency_ms"], m["p99_latency_ms"],
-                 m["request_count"], m["byte_count"], m["error_count"], m["timeout_count"],
-                 m["active_connections"], m["connection_pool_utilization"], m["tcp_retransmissions"], m["packet_loss_rate"])
-                for m in metrics
-            ])
+        await self._insert_rows("network_metrics", NETWORK_METRIC_COLUMNS, metrics)
 
     async def insert_cost_metrics(self, metrics: List[Dict[str, Any]]):
         """Insert cost metrics into TimescaleDB"""
-        if not metrics:
-            return
-            
-        async with self.pool.acquire() as conn:
-            await conn.executemany("""
-                INSERT INTO cost_metrics (
-                    time, resource_id, resource_type, resource_name, region, environment, cost_center,
-                    hourly_cost, daily_cost, monthly_cost, usage_quantity, usage_unit,
-                    estimated_waste, optimization_potential, rightsizing_recommendation
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
-                )
-            """, [
-                (m["time"], m["resource_id"], m["resource_type"], m["resource_name"], m["region"], m["environment"], m["cost_center"],
-                 m["hourly_cost"], m["daily_cost"], m["monthly_cost"], m["usage_quantity"], m["usage_unit"],
-                 m["estimated_waste"], m["optimization_potential"], m["rightsizing_recommendation"])
-                for m in metrics
-            ])
+        await self._insert_rows("cost_metrics", COST_METRIC_COLUMNS, metrics)
 
     async def insert_business_value_metrics(self, metrics: List[Dict[str, Any]]):
         """Insert business value metrics into TimescaleDB"""
-        if not metrics:
-            return
-            
-        async with self.pool.acquire() as conn:
-            await conn.executemany("""
-                INSERT INTO business_value_metrics (
-                    time, metric_type, category, service_name, cluster_name, region, team,
-                    cost_savings_usd, time_savings_hours, efficiency_gain_percent, risk_reduction_score,
-                    initiative_name, description, measurement_method, confidence_level
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
-                )
-            """, [
-                (m["time"], m["metric_type"], m["category"], m["service_name"], m["cluster_name"], m["region"], m["team"],
-                 m["cost_savings_usd"], m["time_savings_hours"], m["efficiency_gain_percent"], m["risk_reduction_score"],
-                 m["initiative_name"], m["description"], m["measurement_method"], m["confidence_level"])
-                for m in metrics
-            ])
+        await self._insert_rows("business_value_metrics", BUSINESS_VALUE_METRIC_COLUMNS, metrics)
 
     async def generate_historical_data(self, hours: int = 72):
         """Generate historical data for the last N hours"""
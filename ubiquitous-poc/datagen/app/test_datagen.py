@@ -6,12 +6,14 @@ Validates all components of the data generation system
 
 import asyncio
 import logging
+import random
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
 from aws_infrastructure_generator import AWSInfrastructureGenerator
 from metrics_generator import MetricsGenerator
 from database_populator import DatabasePopulator
+from enterprise_topology_generator import EnterpriseTopologyGenerator, RDS_INSERT_QUERY, POD_NAME_ROLL
 
 
 class DataGeneratorTester:
@@ -47,7 +49,9 @@ class DataGeneratorTester:
             ('metrics_generation', self.test_metrics_generation),
             ('database_connections', self.test_database_connections),
             ('data_population', self.test_data_population),
-            ('realtime_generation', self.test_realtime_generation)
+            ('realtime_generation', self.test_realtime_generation),
+            ('rds_replica_constraints', self.test_rds_replica_constraints),
+            ('pod_name_roll', self.test_pod_name_roll)
         ]
         
         passed = 0
@@ -312,6 +316,90 @@ class DataGeneratorTester:
             self.logger.error(f"Real-time generation test failed: {e}")
             return False
     
+    async def test_rds_replica_constraints(self) -> bool:
+        """Test that read replicas load under the unique identifier/arn constraints"""
+        # Only nodes under this prefix are created and removed, so the demo graph is left intact
+        prefix = 'datagen-test-rds'
+        cleanup_query = "MATCH (d:RDSInstance) WHERE d.identifier STARTS WITH $prefix DETACH DELETE d"
+        
+        generator = EnterpriseTopologyGenerator()
+        try:
+            generator.create_enhanced_constraints_and_indexes()
+            
+            # Replicas inherit every field from their primary except the ones in the delta
+            database = {
+                'identifier': prefix, 'arn': f'arn:aws:rds:us-east-1:123456789012:db:{prefix}',
+                'engine': 'postgres', 'region': 'us-east-1', 'cost_monthly': 100.0,
+                'replicas': [
+                    {'identifier': f'{prefix}-replica-{n:02d}',
+                     'arn': f'arn:aws:rds:us-east-1:123456789012:db:{prefix}-replica-{n:02d}',
+                     'read_replica_source': prefix, 'cost_monthly': 70.0}
+                    for n in (1, 2)
+                ]
+            }
+            
+            with generator.driver.session() as session:
+                session.run(cleanup_query, prefix=prefix).consume()
+                try:
+                    session.run(RDS_INSERT_QUERY, rows=[database]).consume()
+                    record = session.run("""
+                        MATCH (d:RDSInstance)
+                        WHERE d.identifier STARTS WITH $prefix
+                        RETURN count(d) as count, count(DISTINCT d.arn) as arns,
+                               count(CASE WHEN d.engine = 'postgres' THEN 1 END) as inherited
+                    """, prefix=prefix).single()
+                finally:
+                    session.run(cleanup_query, prefix=prefix).consume()
+            
+            if record['count'] != 3 or record['arns'] != 3 or record['inherited'] != 3:
+                self.logger.error(f"Unexpected RDS load: {dict(record)}")
+                return False
+            
+            self.logger.info("RDS replica constraint validation successful")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"RDS replica constraint test failed: {e}")
+            return False
+        finally:
+            generator.close()
+    
+    async def test_pod_name_roll(self) -> bool:
+        """Test that the vulnerability roll maps pod-name suffixes onto [0, 1) and falls back to rand()"""
+        generator = EnterpriseTopologyGenerator()
+        try:
+            # Same "-NNNN-xxDD" suffix shape as the pod generator, plus both ends of its range
+            suffixed = ['trading-gateway-1000-aa10', 'trading-gateway-9999-zz99'] + [
+                f"risk-calculator-{random.randint(1000, 9999)}-{random.choice('abc')}{random.choice('xyz')}{random.randint(10, 99)}"
+                for _ in range(50)
+            ]
+            unsuffixed = ['trading-gateway', 'legacy-pod-ab', 'order-gateway-abcd-efgh'] * 10
+            
+            query = "UNWIND $names AS name WITH name, {name: name} AS p RETURN %s AS roll" % POD_NAME_ROLL
+            with generator.driver.session() as session:
+                rolls = [r['roll'] for r in session.run(query, names=suffixed)]
+                repeat = [r['roll'] for r in session.run(query, names=suffixed)]
+                fallback = [r['roll'] for r in session.run(query, names=unsuffixed)]
+            
+            if rolls[0] != 0.0 or rolls[1] != 809999 / 810000:
+                self.logger.error(f"Roll range endpoints wrong: {rolls[:2]}")
+                return False
+            if rolls != repeat or not all(0.0 <= roll < 1.0 for roll in rolls):
+                self.logger.error("Suffix rolls are not stable values in [0, 1)")
+                return False
+            if not all(0.0 <= roll < 1.0 for roll in fallback) or len(set(fallback)) == 1:
+                self.logger.error("Names without the suffix did not fall back to rand()")
+                return False
+            
+            self.logger.info("Pod name roll validation successful")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Pod name roll test failed: {e}")
+            return False
+        finally:
+            generator.close()
+    
     def print_detailed_results(self):
         """Print detailed test results"""
         print("\n" + "="*50)
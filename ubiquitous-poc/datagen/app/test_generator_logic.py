@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Generator Logic Tests
+Database-free checks of the lookup tables and draw helpers the generators rely on
+"""
+
+import math
+import random
+
+from generator_utils import pick_weighted
+from aws_infrastructure_generator import AWSInfrastructureGenerator
+from capital_group_generator import CapitalGroupDataGenerator
+from enterprise_topology_generator import EnterpriseTopologyGenerator
+
+
+def _weighted_tables():
+    """Every (population, cumulative weights) table drawn with pick_weighted"""
+    for cls in (AWSInfrastructureGenerator, CapitalGroupDataGenerator):
+        for name, value in vars(cls).items():
+            if (name.isupper() and isinstance(value, tuple) and len(value) == 2
+                    and isinstance(value[1], tuple) and isinstance(value[1][0], int)):
+                yield f"{cls.__name__}.{name}", value
+
+
+def test_pick_weighted_matches_random_choices():
+    """pick_weighted consumes one random() per draw and lands on the same value as random.choices"""
+    tables = list(_weighted_tables())
+    assert tables
+
+    for name, (population, cum_weights) in tables:
+        assert len(population) == len(cum_weights), name
+        assert list(cum_weights) == sorted(cum_weights), name
+
+        random.seed(name)
+        picked = [pick_weighted((population, cum_weights)) for _ in range(2000)]
+        random.seed(name)
+        expected = [random.choices(population, cum_weights=cum_weights)[0] for _ in range(2000)]
+        assert picked == expected, name
+
+
+def test_vulnerability_tiers_reproduce_sequential_odds():
+    """Tier thresholds equal the old passes: 2% critical, then 8% high, then 15% medium of the rest"""
+    tiers = EnterpriseTopologyGenerator._VULNERABILITY_TIERS
+    assert [t["status"] for t in tiers] == ["critical", "high", "medium", "clean"]
+
+    remaining, upto = 1.0, 0.0
+    for tier, rate in zip(tiers, (0.02, 0.08, 0.15, 1.0)):
+        upto += remaining * rate
+        remaining -= remaining * rate
+        assert math.isclose(tier["upto"], upto), tier["status"]
+    assert tiers[-1]["upto"] == 1.0
+
+
+if __name__ == "__main__":
+    test_pick_weighted_matches_random_choices()
+    test_vulnerability_tiers_reproduce_sequential_odds()
+    print("✅ Generator logic checks passed")